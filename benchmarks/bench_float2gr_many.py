@@ -0,0 +1,25 @@
+"""Timing of float2gr_many against the scalar float2gr_empty_zero loop.
+
+python -m benchmarks.bench_float2gr_many
+"""
+
+import random
+import time
+
+from utils.numbers import float2gr_empty_zero, float2gr_many
+
+
+def main(count: int = 200_000) -> None:
+    numbers = [random.uniform(-1e7, 1e7) for _ in range(count)]
+    start = time.perf_counter()
+    expected = [float2gr_empty_zero(number) for number in numbers]
+    scalar = time.perf_counter() - start
+    start = time.perf_counter()
+    result = float2gr_many(numbers, empty_zero=True)
+    batch = time.perf_counter() - start
+    assert result == expected
+    print(f"{count} numbers, scalar loop: {scalar:.3f}s, float2gr_many: {batch:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
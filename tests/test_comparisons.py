@@ -1,6 +1,24 @@
+import importlib.util
+import random
+from dataclasses import dataclass
+
 import pytest
 
-from utils.comparisons import compare_values, find
+from utils.comparisons import (
+    GREEK_OPERATORS,
+    OPERATORS,
+    AdaptiveQuery,
+    ColumnarCollection,
+    IndexedCollection,
+    bind_operator,
+    compare_values,
+    compile_query,
+    find,
+    find_parallel,
+    is_match,
+    iter_find,
+)
+from utils.texts import grup
 
 
 @pytest.mark.parametrize(
@@ -48,3 +66,445 @@ def test_find():
     )
     assert len(results) == 1
     assert results[0].name == "Alice"
+
+
+@dataclass
+class Employee:
+    id: int
+    name: str
+    tags: list
+    grade: int
+
+
+EMPLOYEES = [
+    Employee(1, "Alice", ["tag1", "tag2"], 3),
+    Employee(2, "Bob", ["tag2", "tag3"], 1),
+    Employee(3, "Charlie", ["tag1", "tag3"], 2),
+    Employee(4, "Dora", [], 2),
+    Employee(5, "Alex", [["nested"]], 5),
+]
+
+QUERIES = [
+    {"id": ("=", 2)},
+    {"grade": (">=", 2), "name": ("startsWith", "A")},
+    {"name": ("in", {"Bob", "Dora"})},
+    {"name": ("not_in", ("Bob", "Dora"))},
+    {"name": ("in", "Alice and Bob")},
+    {"tags": ("anyInList", ["tag1", "tag9"])},
+    {"tags": ("allInList", ("tag1", "tag2", "tag3"))},
+    {"tags": ("not_anyInList", ["tag3"])},
+    {"tags": ("not_allInList", ["tag1", "tag2"])},
+    {"tags": ("anyInList", [["nested"]])},
+    {"name": ("contains", "li"), "id": ("!=", 1)},
+    {"name": ("endsWith", "x"), "grade": ("<", 9)},
+]
+
+
+@pytest.mark.parametrize("search_attrs", QUERIES)
+def test_compile_query_matches_is_match(search_attrs):
+    predicate = compile_query(search_attrs, Employee)
+    expected = [obj for obj in EMPLOYEES if is_match(search_attrs, obj)]
+    assert [obj for obj in EMPLOYEES if predicate(obj)] == expected
+    assert (
+        find(search_attributes=search_attrs, class_=Employee, class_instances=EMPLOYEES)
+        == expected
+    )
+
+
+def test_compile_query_invalid_attribute():
+    predicate = compile_query({"salary": ("=", 1)}, Employee)
+    assert not any(predicate(obj) for obj in EMPLOYEES)
+
+
+def test_compile_query_invalid_operator():
+    with pytest.raises(ValueError):
+        compile_query({"id": ("~", 1)}, Employee)
+
+
+@pytest.mark.parametrize(
+    "operator,value,criterion",
+    [
+        ("in", [1], [[1], [2]]),
+        ("not_in", [3], [[1], [2]]),
+        ("in", 1, [[1], 1]),
+        ("anyInList", ["a"], ["a", "b"]),
+    ],
+)
+def test_bind_operator_unhashable(operator, value, criterion):
+    assert bind_operator(operator, criterion)(value) is True
+
+
+def _random_employees(count, seed=0):
+    rnd = random.Random(seed)
+    names = ["Alice", "Alex", "Bob", "Charlie", "Dora", "Άννα", ""]
+    return [
+        Employee(
+            i,
+            rnd.choice(names),
+            rnd.sample(["tag1", "tag2", "tag3"], rnd.randint(0, 2)),
+            rnd.randint(0, 5),
+        )
+        for i in range(count)
+    ]
+
+
+INDEXED_QUERIES = QUERIES[:9] + [
+    {"grade": ("<", 3)},
+    {"grade": ("<=", 3), "name": ("=", "Bob")},
+    {"grade": (">", 3), "name": ("startsWith", "Al")},
+    {"grade": (">=", 5), "id": ("<", 100)},
+    {"name": ("startsWith", "")},
+    {"name": ("startsWith", "Ά")},
+    {"name": ("in", ["Άννα", "Nobody"]), "grade": ("!=", 0)},
+    {"id": ("in", [1, 2, 500])},
+]
+
+
+NAN = float("nan")
+
+NAN_QUERIES = [
+    {"grade": ("=", NAN)},
+    {"grade": ("=", float("nan"))},
+    {"grade": ("<", NAN)},
+    {"grade": (">=", NAN)},
+    {"grade": ("in", [NAN, 1])},
+    {"grade": ("in", [float("nan"), 1])},
+    {"grade": ("!=", NAN)},
+]
+
+
+def _employees_with_nan(count, seed=0):
+    employees = _random_employees(count, seed)
+    for i, obj in enumerate(employees[::7]):
+        obj.grade = NAN if i % 2 else float("nan")
+    for obj in employees[3::7]:
+        obj.grade = obj.grade + 0.5
+    return employees
+
+
+@pytest.mark.parametrize("search_attrs", INDEXED_QUERIES + NAN_QUERIES)
+def test_indexed_collection_matches_find(search_attrs):
+    employees = _employees_with_nan(300)
+    collection = IndexedCollection(Employee, employees)
+    expected = find(
+        search_attributes=search_attrs, class_=Employee, class_instances=employees
+    )
+    assert collection.find(search_attrs) == expected
+
+
+def test_indexed_collection_add_remove():
+    employees = _employees_with_nan(200, seed=1)
+    collection = IndexedCollection(Employee, employees, index_attributes=["grade"])
+    for obj in employees[::3]:
+        collection.remove(obj)
+    extra = _employees_with_nan(50, seed=2)
+    for obj in extra:
+        collection.add(obj)
+    remaining = [obj for i, obj in enumerate(employees) if i % 3] + extra
+    assert len(collection) == len(remaining)
+    assert list(collection) == remaining
+    for search_attrs in INDEXED_QUERIES + NAN_QUERIES:
+        assert collection.find(search_attrs) == find(
+            search_attributes=search_attrs,
+            class_=Employee,
+            class_instances=remaining,
+        )
+    assert employees[0] not in collection
+    with pytest.raises(KeyError):
+        collection.remove(employees[0])
+    with pytest.raises(ValueError):
+        collection.add(extra[0])
+
+
+def test_indexed_collection_unorderable_values():
+    collection = IndexedCollection(
+        Employee, [Employee(1, "A", [], 1), Employee(2, "B", [], None)]
+    )
+    assert collection.find({"grade": ("=", None)})[0].id == 2
+    with pytest.raises(TypeError):
+        collection.find({"grade": (">", 0)})
+
+
+def test_indexed_collection_invalid():
+    with pytest.raises(ValueError):
+        IndexedCollection(Employee, index_attributes=["salary"])
+    collection = IndexedCollection(Employee, EMPLOYEES)
+    assert collection.find({"salary": ("=", 1)}) == []
+    with pytest.raises(ValueError):
+        collection.find({"id": ("~", 1)})
+
+
+@dataclass
+class Payment:
+    id: int
+    name: str
+    amount: float
+    paid: bool
+    tags: list
+    code: object
+
+
+def _random_payments(count, seed=0):
+    rnd = random.Random(seed)
+    names = ["Alice", "Alex", "Bob", "Charlie", "Dora", "Άννα", ""]
+    return [
+        Payment(
+            i,
+            rnd.choice(names),
+            rnd.choice([0.0, 10.5, 99.99, -3.0, float("nan")]),
+            rnd.random() < 0.5,
+            rnd.sample(["tag1", "tag2", "tag3"], rnd.randint(0, 2)),
+            rnd.choice([1, "1", None, 2**70]),
+        )
+        for i in range(count)
+    ]
+
+
+COLUMNAR_QUERIES = [
+    {"id": ("=", 7)},
+    {"id": ("<", 50), "name": ("startsWith", "Al")},
+    {"id": (">=", 2.5), "amount": ("<=", 10.5)},
+    {"amount": (">", 0)},
+    {"amount": ("!=", 99.99), "paid": ("=", True)},
+    {"name": ("in", ["Bob", "Άννα"])},
+    {"name": ("not_in", ("Bob", "Άννα")), "id": ("in", {1, 2, 3, 4, 5, 6})},
+    {"name": ("in", "Alice and Bob")},
+    {"name": ("contains", "li")},
+    {"name": ("not_contains", "o"), "paid": ("=", False)},
+    {"tags": ("anyInList", ["tag1"]), "paid": ("!=", False)},
+    {"tags": ("not_allInList", ["tag2"])},
+    {"code": ("=", 1)},
+    {"code": ("in", [2**70, None])},
+    {"id": ("=", 2**70)},
+    {"amount": ("in", [10.5, float("nan")])},
+    {"name": ("=", 1)},
+]
+
+
+@pytest.mark.parametrize("search_attrs", COLUMNAR_QUERIES)
+def test_columnar_collection_matches_find(search_attrs):
+    pytest.importorskip("numpy")
+    payments = _random_payments(500)
+    collection = ColumnarCollection(Payment, payments)
+    expected = find(
+        search_attributes=search_attrs, class_=Payment, class_instances=payments
+    )
+    assert collection.find(search_attrs) == expected
+    assert collection.find_indices(search_attrs).tolist() == [p.id for p in expected]
+
+
+def test_columnar_collection_errors():
+    pytest.importorskip("numpy")
+    collection = ColumnarCollection(Payment, _random_payments(10))
+    assert collection.find({"salary": ("=", 1)}) == []
+    with pytest.raises(ValueError):
+        collection.find({"id": ("~", 1)})
+    assert collection.column("id").dtype.kind == "i"
+    assert collection.column("code").dtype.kind == "O"
+
+
+@pytest.mark.parametrize(
+    "search_attrs",
+    [
+        {"name": ("=", "a\ud800")},
+        {"name": ("contains", "\ud800")},
+        {"name": ("in", ["Bob", "\ud800"])},
+        {"name": ("startsWith", "Al")},
+        {"name": ("contains_gr", "ΑΝ")},
+        {"name": ("eq_gr", "a\\ud800")},
+    ],
+)
+def test_columnar_collection_lone_surrogates(search_attrs):
+    pytest.importorskip("numpy")
+    payments = _random_payments(20)
+    payments[3].name = "a\ud800"
+    for instances in (payments, _random_payments(20)):
+        collection = ColumnarCollection(Payment, instances)
+        expected = find(
+            search_attributes=search_attrs, class_=Payment, class_instances=instances
+        )
+        assert collection.find(search_attrs) == expected
+
+
+class CountingText:
+    """Text whose containment checks are counted and always succeed"""
+
+    calls = 0
+
+    def __contains__(self, item):
+        CountingText.calls += 1
+        return True
+
+
+@dataclass
+class Row:
+    id: int
+    text: CountingText
+
+
+@pytest.mark.parametrize("search_attrs", INDEXED_QUERIES)
+def test_adaptive_find_matches_find(search_attrs):
+    employees = _random_employees(2000)
+    expected = find(
+        search_attributes=search_attrs, class_=Employee, class_instances=employees
+    )
+    assert (
+        find(
+            search_attributes=search_attrs,
+            class_=Employee,
+            class_instances=employees,
+            adaptive=True,
+        )
+        == expected
+    )
+    query = AdaptiveQuery(search_attrs, Employee, sample_every=3, reorder_every=2)
+    assert query.filter(employees) == expected
+
+
+def test_adaptive_query_runs_selective_condition_first():
+    rows = [Row(i % 100, CountingText()) for i in range(10000)]
+    search_attrs = {"text": ("contains", "x"), "id": ("=", 5)}
+    CountingText.calls = 0
+    expected = find(search_attributes=search_attrs, class_=Row, class_instances=rows)
+    plain_calls = CountingText.calls
+    CountingText.calls = 0
+    query = AdaptiveQuery(search_attrs, Row, sample_every=8, reorder_every=4)
+    assert query.filter(rows) == expected
+    assert CountingText.calls < plain_calls / 10
+    stats = query.stats()
+    assert [s.attribute for s in stats] == ["id", "text"]
+    assert stats[0].pass_rate < 0.1
+    assert stats[1].pass_rate == 1.0
+    assert stats[0].evaluations == 10000 // 8
+
+
+def test_adaptive_query_invalid_attribute():
+    query = AdaptiveQuery({"salary": ("=", 1)}, Employee)
+    assert query.filter(EMPLOYEES) == []
+
+
+def test_iter_find_streams():
+    employees = _random_employees(100)
+    search_attrs = {"grade": (">", 2), "name": ("startsWith", "A")}
+    expected = find(
+        search_attributes=search_attrs, class_=Employee, class_instances=employees
+    )
+    consumed = []
+
+    def records():
+        for obj in employees:
+            consumed.append(obj)
+            yield obj
+
+    matches = iter_find(
+        search_attributes=search_attrs, class_=Employee, class_instances=records()
+    )
+    first = next(matches)
+    assert first is expected[0]
+    assert len(consumed) < len(employees)
+    assert [first, *matches] == expected
+
+
+@pytest.mark.parametrize("chunk_size,workers", [(7, 2), (1000, 2), (50, 1)])
+def test_find_parallel_matches_find(chunk_size, workers):
+    employees = _random_employees(300)
+    for search_attrs in INDEXED_QUERIES[:4]:
+        expected = find(
+            search_attributes=search_attrs, class_=Employee, class_instances=employees
+        )
+        result = find_parallel(
+            search_attributes=search_attrs,
+            class_=Employee,
+            class_instances=employees,
+            chunk_size=chunk_size,
+            workers=workers,
+        )
+        assert len(result) == len(expected)
+        assert all(a is b for a, b in zip(result, expected))
+
+
+def test_find_parallel_invalid():
+    assert (
+        find_parallel(
+            search_attributes={"salary": ("=", 1)},
+            class_=Employee,
+            class_instances=EMPLOYEES,
+        )
+        == []
+    )
+    with pytest.raises(ValueError):
+        find_parallel(
+            search_attributes={"id": ("=", 1)},
+            class_=Employee,
+            class_instances=EMPLOYEES,
+            chunk_size=0,
+        )
+
+
+@pytest.mark.parametrize(
+    "operator,a,b,expected",
+    [
+        ("eq_gr", "Άννα", "ΑΝΝΑ", True),
+        ("eq_gr", "Άννα", "Αννα ", False),
+        ("ne_gr", "Άννα", "αννα", False),
+        ("contains_gr", "Παπαδόπουλος", "ΔΟΠ", True),
+        ("not_contains_gr", "Παπαδόπουλος", "δοπ", False),
+        ("startsWith_gr", "Ώρα", "ω", True),
+        ("endsWith_gr", "Γεωργίου", "ιου", True),
+        ("endsWith_gr", "Γεωργίου", "ιοσ", False),
+    ],
+)
+def test_compare_values_greek(operator, a, b, expected):
+    assert compare_values(operator, a, b) == expected
+    assert bind_operator(operator, b)(a) == expected
+
+
+GREEK_QUERIES = [
+    {"name": ("eq_gr", "αννα")},
+    {"name": ("ne_gr", "ΑΛΕΞ"), "grade": (">", 1)},
+    {"name": ("contains_gr", "lí")},
+    {"name": ("not_contains_gr", "ν")},
+    {"name": ("startsWith_gr", "ά")},
+    {"name": ("endsWith_gr", "E")},
+]
+
+
+@pytest.mark.parametrize("search_attrs", GREEK_QUERIES)
+def test_find_greek_operators(search_attrs):
+    employees = _random_employees(300)
+    _, (operator, criterion) = next(iter(search_attrs.items()))
+    expected = [
+        obj
+        for obj in employees
+        if is_match(search_attrs, obj)
+        and OPERATORS[GREEK_OPERATORS[operator]](grup(obj.name), grup(criterion))
+    ]
+    assert expected
+    assert (
+        find(
+            search_attributes=search_attrs,
+            class_=Employee,
+            class_instances=employees,
+        )
+        == expected
+    )
+    assert IndexedCollection(Employee, employees).find(search_attrs) == expected
+    if importlib.util.find_spec("numpy"):
+        assert ColumnarCollection(Employee, employees).find(search_attrs) == expected
+
+
+def test_greek_operator_normalizes_each_distinct_value_once(monkeypatch):
+    calls = []
+
+    def counting_grup(text):
+        calls.append(text)
+        return grup(text)
+
+    monkeypatch.setattr("utils.comparisons.grup", counting_grup)
+    employees = _random_employees(1000)
+    find(
+        search_attributes={"name": ("eq_gr", "Άννα")},
+        class_=Employee,
+        class_instances=employees,
+    )
+    assert len(calls) == len({obj.name for obj in employees}) + 1
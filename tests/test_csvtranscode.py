@@ -0,0 +1,120 @@
+import io
+
+import pytest
+
+from utils.csvtranscode import TranscodeError, main, transcode_csv
+
+SOURCE = """name;date;amount;iso
+Άννα;15/06/2024;1.234,56;2024-06-15
+Bob;;-0,99;1999-12-31
+Γιώργος;01/01/2000;12.345.678,90;
+"""
+
+EXPECTED = """name;date;amount;iso
+Άννα;2024-06-15;1234.56;15/06/2024
+Bob;;-0.99;31/12/1999
+Γιώργος;2000-01-01;12345678.90;
+"""
+
+
+def _transcode(source, **kwargs):
+    target = io.StringIO(newline="")
+    stats = transcode_csv(io.StringIO(source, newline=""), target, **kwargs)
+    return target.getvalue(), stats
+
+
+@pytest.mark.parametrize("chunk_size,workers", [(10_000, 1), (1, 1), (1, 2)])
+def test_transcode_csv(chunk_size, workers):
+    result, stats = _transcode(
+        SOURCE,
+        conversions={"gr2iso": ["date"], "gr2float": ["amount"], "iso2gr": ["3"]},
+        delimiter=";",
+        chunk_size=chunk_size,
+        workers=workers,
+    )
+    assert result == EXPECTED
+    assert stats.rows == 3
+    assert stats.rows_per_second > 0
+
+
+def test_transcode_csv_round_trip():
+    result, _ = _transcode(
+        EXPECTED,
+        conversions={"iso2gr": ["date"], "float2gr": ["amount"], "gr2iso": ["iso"]},
+        delimiter=";",
+    )
+    assert result == SOURCE
+
+
+def test_transcode_csv_no_header():
+    result, stats = _transcode(
+        "15/06/2024,1\n31/12/1999,2\n",
+        conversions={"gr2iso": ["0"]},
+        header=False,
+    )
+    assert result == "2024-06-15,1\n1999-12-31,2\n"
+    assert stats.rows == 2
+
+
+def test_transcode_csv_errors():
+    source = "date\n15/06/2024\n31/02/2024\n"
+    with pytest.raises(TranscodeError) as exc_info:
+        _transcode(source, conversions={"gr2iso": ["date"]})
+    assert exc_info.value.row == 1
+    assert exc_info.value.value == "31/02/2024"
+    result, _ = _transcode(source, conversions={"gr2iso": ["date"]}, errors="keep")
+    assert result == "date\n2024-06-15\n31/02/2024\n"
+    with pytest.raises(ValueError):
+        _transcode(source, conversions={"gr2iso": ["missing"]})
+    with pytest.raises(ValueError):
+        _transcode(source, conversions={"gr2xyz": ["date"]})
+
+
+def test_transcode_csv_errors_in_workers():
+    source = "date\n15/06/2024\n31/02/2024\n01/01/2000\n"
+    with pytest.raises(TranscodeError) as exc_info:
+        _transcode(source, conversions={"gr2iso": ["date"]}, chunk_size=1, workers=2)
+    assert exc_info.value.row == 1
+    assert exc_info.value.value == "31/02/2024"
+    assert exc_info.value.conversion == "gr2iso"
+
+
+def test_transcode_csv_exact_amounts():
+    source = "amount\n1.234.567.890.123.456,78\n12.345.678.901.234.567\n-0,005\n"
+    result, _ = _transcode(source, conversions={"gr2float": ["amount"]}, delimiter=";")
+    assert result == "amount\n1234567890123456.78\n12345678901234567\n-0.005\n"
+    back, _ = _transcode(result, conversions={"float2gr": ["amount"]}, delimiter=";")
+    assert (
+        back == "amount\n1.234.567.890.123.456,78\n12.345.678.901.234.567,00\n-0,00\n"
+    )
+
+
+@pytest.mark.parametrize("value", ["1.2.3,4", "1234.567,8", "1,2,3", "12.34"])
+def test_transcode_csv_bad_grouping(value):
+    with pytest.raises(TranscodeError):
+        _transcode(
+            f"amount\n{value}\n", conversions={"gr2float": ["amount"]}, delimiter=";"
+        )
+
+
+@pytest.mark.parametrize("value", ["nan", "inf", "1e5", "1,5", "1.2.3"])
+def test_transcode_csv_bad_standard_number(value):
+    with pytest.raises(TranscodeError):
+        _transcode(
+            f"amount\n{value}\n", conversions={"float2gr": ["amount"]}, delimiter=";"
+        )
+
+
+def test_main(tmp_path, capsys):
+    source = tmp_path / "in.csv"
+    target = tmp_path / "out.csv"
+    source.write_text(SOURCE, encoding="utf-8")
+    argv = [str(source), str(target), "--delimiter", ";", "--gr2iso", "date"]
+    argv += ["--gr2float", "amount", "--iso2gr", "iso", "--chunk-size", "2"]
+    assert main(argv) == 0
+    assert target.read_text(encoding="utf-8") == EXPECTED
+    assert "rows/s" in capsys.readouterr().err
+    source.write_text("date\n99/99/9999\n", encoding="utf-8")
+    assert main([str(source), str(target), "--gr2iso", "date"]) == 1
+    argv = [str(source), str(target), "--gr2iso", "date", "--workers", "2"]
+    assert main(argv + ["--chunk-size", "1", "--quiet"]) == 1
@@ -1,20 +1,43 @@
-from datetime import date, datetime
+from calendar import monthrange
+import random
+from datetime import date, datetime, time, timedelta
 
 import pytest
 
 from utils.datecalculations import (
     day_night_hours_from_range,
+    day_night_hours_from_ranges,
+    DayNightHours,
+    _day_night_minutes,
     daynight_hours,
+    daynight_hours_many,
     delta_hours,
+    delta_hours_many,
+    delta_minutes,
     do_overlap,
+    find_overlaps,
     greek_holidays,
+    holiday_name,
+    HourBuckets,
+    is_holiday,
+    is_holiday_many,
     misthos_hour_diff,
+    MONDAY_TO_FRIDAY,
     month_monday2friday_days,
     month_specific_days,
     month_specific_days_gr,
+    month_specific_days_many,
+    ORTHODOX_EASTER,
     orthodox_easter,
     round_half,
+    Shift,
+    ShiftClassifier,
+    ShiftSchedule,
     time_range,
+    time_ranges_many,
+    TimeRangeError,
+    weekday_mask,
+    WorkingCalendar,
 )
 
 
@@ -26,6 +49,56 @@ def test_month_monday2friday_days(year, month, expected):
     assert month_monday2friday_days(year, month) == expected
 
 
+MONTHS_1900_2100 = [
+    (year, month) for year in range(1900, 2101) for month in range(1, 13)
+]
+
+
+def _month_weekdays(year, month):
+    """Weekday of every day of the month, the reference day by day loop"""
+    return [
+        datetime(year, month, day).date().weekday()
+        for day in range(1, monthrange(year, month)[1] + 1)
+    ]
+
+
+def test_month_specific_days_exhaustive():
+    for year, month in MONTHS_1900_2100:
+        weekdays = _month_weekdays(year, month)
+        assert month_monday2friday_days(year, month) == sum(w < 5 for w in weekdays)
+        for mask in range(128):
+            wanted = {w for w in range(7) if mask >> w & 1}
+            expected = sum(w in wanted for w in weekdays)
+            assert month_specific_days(year, month, wanted) == expected
+
+
+def test_month_specific_days_many_exhaustive():
+    np = pytest.importorskip("numpy")
+    years, months = np.array(MONTHS_1900_2100).T
+    for mask in range(128):
+        wanted = {w for w in range(7) if mask >> w & 1}
+        expected = [month_specific_days(y, m, wanted) for y, m in MONTHS_1900_2100]
+        assert month_specific_days_many(years, months, mask).tolist() == expected
+
+
+def test_month_specific_days_many_per_row_masks():
+    np = pytest.importorskip("numpy")
+    masks = [MONDAY_TO_FRIDAY, weekday_mask({0}), weekday_mask({5, 6}), 0]
+    counts = month_specific_days_many([2024, 2024, 2026, 2026], [6, 7, 1, 2], masks)
+    assert counts.dtype == np.int64
+    assert counts.tolist() == [20, 5, 9, 0]
+    assert month_specific_days_many([2024], [6]).tolist() == [20]
+    with pytest.raises(ValueError):
+        month_specific_days_many([2024], [13])
+
+
+def test_weekday_mask():
+    assert weekday_mask({0, 1, 2, 3, 4}) == MONDAY_TO_FRIDAY
+    assert weekday_mask(set()) == 0
+    with pytest.raises(ValueError):
+        weekday_mask({7})
+
+
 def test_month_specific_days_gr_default_days():
     # Default is Monday to Friday
     assert month_specific_days_gr(2024, 6) == 20  # June 2024 has 20 working weekdays
@@ -296,3 +369,423 @@ def test_greek_movable_holidays():
     assert holidays_2026["Κυριακή του Πάσχα"] == date(2026, 4, 12)
     assert holidays_2026["Δευτέρα του Πάσχα"] == date(2026, 4, 13)
     assert holidays_2026["Δευτέρα του Αγίου Πνεύματος"] == date(2026, 6, 1)
+
+
+def _brute_working_days(date_from, date_to, extra=()):
+    count = 0
+    day = date_from
+    while day <= date_to:
+        holidays = greek_holidays(day.year).values()
+        if day.weekday() < 5 and day not in holidays and day not in extra:
+            count += 1
+        day += timedelta(days=1)
+    return count
+
+
+def test_working_calendar():
+    extra = {date(2024, 11, 11), date(2025, 6, 7)}  # a Monday and a Saturday
+    calendar = WorkingCalendar(2023, 2026, extra_holidays=extra)
+    assert calendar.is_working_day(date(2024, 11, 8))
+    assert not calendar.is_working_day(date(2024, 11, 11))
+    assert not calendar.is_working_day(date(2024, 5, 3))  # Good Friday
+    assert not calendar.is_working_day(date(2024, 6, 29))  # Saturday
+    for year in range(2023, 2027):
+        for month in range(1, 13):
+            first = date(year, month, 1)
+            last = date(year, month, monthrange(year, month)[1])
+            expected = _brute_working_days(first, last, extra)
+            assert calendar.working_days_in_month(year, month) == expected
+    assert calendar.working_days_between(
+        date(2023, 1, 1), date(2026, 12, 31)
+    ) == _brute_working_days(date(2023, 1, 1), date(2026, 12, 31), extra)
+    assert calendar.working_days_between(date(2024, 5, 6), date(2024, 5, 6)) == 0
+    assert calendar.working_days_between(date(2024, 5, 7), date(2024, 5, 7)) == 1
+    assert calendar.working_days_between(date(2024, 5, 8), date(2024, 5, 7)) == 0
+
+
+def test_working_calendar_errors():
+    with pytest.raises(ValueError):
+        WorkingCalendar(1899, 2000)
+    with pytest.raises(ValueError):
+        WorkingCalendar(2025, 2024)
+    calendar = WorkingCalendar(2024, 2024)
+    with pytest.raises(ValueError):
+        calendar.is_working_day(date(2025, 1, 2))
+    with pytest.raises(ValueError):
+        calendar.working_days_in_month(2023, 12)
+
+
+def test_working_calendar_save_load(tmp_path):
+    path = tmp_path / "calendar.bin"
+    calendar = WorkingCalendar(2020, 2030, extra_holidays=[date(2025, 3, 3)])
+    calendar.save(path)
+    loaded = WorkingCalendar.load(path)
+    assert (loaded.first_year, loaded.last_year) == (2020, 2030)
+    day = date(2020, 1, 1)
+    while day <= date(2030, 12, 31):
+        assert loaded.is_working_day(day) == calendar.is_working_day(day)
+        day += timedelta(days=1)
+    for year in range(2020, 2031):
+        for month in range(1, 13):
+            assert loaded.working_days_in_month(
+                year, month
+            ) == calendar.working_days_in_month(year, month)
+    (tmp_path / "bad.bin").write_bytes(b"NOTACALENDARFILE" + bytes(10))
+    with pytest.raises(ValueError):
+        WorkingCalendar.load(tmp_path / "bad.bin")
+
+
+def test_orthodox_easter_table():
+    assert len(ORTHODOX_EASTER) == 200
+    assert ORTHODOX_EASTER[2024] == date(2024, 5, 5)
+    for year, pascha in ORTHODOX_EASTER.items():
+        assert pascha.weekday() == 6
+        assert orthodox_easter(year) == pascha
+    assert orthodox_easter(2100).year == 2100  # computed outside the table
+
+
+def test_greek_holidays_returns_a_copy():
+    greek_holidays(2024)["Πρωτοχρονιά"] = None
+    assert greek_holidays(2024)["Πρωτοχρονιά"] == date(2024, 1, 1)
+
+
+def test_is_holiday():
+    assert is_holiday(date(2024, 5, 6))
+    assert is_holiday(datetime(2024, 12, 25, 8, 30))
+    assert not is_holiday(date(2024, 5, 7))
+    assert holiday_name(date(2024, 6, 24)) == "Δευτέρα του Αγίου Πνεύματος"
+    assert holiday_name(datetime(2024, 3, 25, 23, 0)) == "Επανάσταση του 1821"
+    assert holiday_name(date(2024, 6, 25)) is None
+    # Easter Sunday on May 1st keeps the fixed holiday name
+    assert holiday_name(date(2005, 5, 1)) == "Πρωτομαγιά"
+    for year in (1900, 1999, 2024, 2099):
+        for name, day in greek_holidays(year).items():
+            assert is_holiday(day)
+            assert holiday_name(day) in greek_holidays(year)
+
+
+def test_is_holiday_many():
+    np = pytest.importorskip("numpy")
+    days = np.arange("2023-12-01", "2025-02-01", dtype="datetime64[D]")
+    expected = [is_holiday(day) for day in days.tolist()]
+    assert is_holiday_many(days).tolist() == expected
+    times = np.array(["2024-05-06T10:30", "NaT", "2024-05-07T00:00"], "datetime64[m]")
+    assert is_holiday_many(times).tolist() == [True, False, False]
+    assert is_holiday_many(np.array([], dtype="datetime64[D]")).shape == (0,)
+
+
+def _brute_day_night_minutes(dfrom, dto):
+    day = night = 0
+    moment = dfrom
+    while moment < dto:
+        if 6 <= moment.hour < 22:
+            day += 1
+        else:
+            night += 1
+        moment += timedelta(minutes=1)
+    return day, night
+
+
+def _random_shift(rnd, max_minutes):
+    start = datetime(2024, 1, 1) + timedelta(minutes=rnd.randrange(0, 60 * 24 * 60))
+    return start, start + timedelta(minutes=rnd.randrange(0, max_minutes))
+
+
+def test_daynight_hours_any_length():
+    rnd = random.Random(21)
+    for _ in range(300):
+        dfrom, dto = _random_shift(rnd, 4 * 24 * 60)
+        day, night = _brute_day_night_minutes(dfrom, dto)
+        hours = daynight_hours(dfrom, dto)
+        assert hours == DayNightHours(round(day / 60, 1), round(night / 60, 1))
+    hours = daynight_hours(datetime(2024, 1, 1, 22), datetime(2024, 1, 4, 6))
+    assert (hours.day_hours, hours.night_hours) == (32, 24)
+    with pytest.raises(ValueError):
+        daynight_hours(datetime(2024, 1, 2), datetime(2024, 1, 1))
+
+
+@pytest.mark.parametrize(
+    "dfrom,dto,expected_day_hours,expected_night_hours",
+    [
+        (datetime(2024, 1, 1, 23), datetime(2024, 1, 2, 23), 16.0, 8.0),
+        (datetime(2024, 1, 1, 21, 31), datetime(2024, 1, 3, 7, 31), 18.0, 16.0),
+        (datetime(2024, 1, 1, 5, 59, 30), datetime(2024, 1, 1, 6, 0, 30), 0.0, 0.0),
+        (datetime(2024, 1, 1, 6), datetime(2024, 1, 1, 6), 0.0, 0.0),
+    ],
+)
+def test_daynight_hours_long_and_partial_minutes(
+    dfrom, dto, expected_day_hours, expected_night_hours
+):
+    hours = daynight_hours(dfrom, dto)
+    assert hours == DayNightHours(expected_day_hours, expected_night_hours)
+    day, night = _day_night_minutes(dfrom, dto)
+    assert day + night == delta_minutes(dfrom, dto)
+
+
+def test_daynight_hours_seconds_property():
+    rnd = random.Random(32)
+    for _ in range(100):
+        start = datetime(2024, 3, 1, 5) + timedelta(seconds=rnd.randrange(0, 2 * 3600))
+        end = start + timedelta(seconds=rnd.randrange(0, 3 * 3600))
+        day_seconds = 0
+        for second in range((end - start) // timedelta(seconds=1)):
+            moment = start + timedelta(seconds=second)
+            day_seconds += 6 <= moment.hour < 22
+        day, night = _day_night_minutes(start, end)
+        assert day == day_seconds // 60
+        assert day + night == delta_minutes(start, end)
+
+
+def test_find_overlaps():
+    rnd = random.Random(23)
+    shifts = [Shift(*_random_shift(rnd, 12 * 60), key=i) for i in range(300)]
+    shifts += [Shift(s.start, s.start, key=-i - 1) for i, s in enumerate(shifts[:60])]
+    shifts += [Shift(s.end, s.end, key=-i - 100) for i, s in enumerate(shifts[:30])]
+    expected = {
+        frozenset((a.key, b.key))
+        for i, a in enumerate(shifts)
+        for b in shifts[i + 1 :]
+        if do_overlap(a.start, a.end, b.start, b.end)
+    }
+    found = [frozenset((a.key, b.key)) for a, b in find_overlaps(shifts)]
+    assert len(found) == len(expected)
+    assert set(found) == expected
+    touching = [
+        Shift(datetime(2024, 1, 1, 8), datetime(2024, 1, 1, 16)),
+        Shift(datetime(2024, 1, 1, 16), datetime(2024, 1, 1, 23)),
+    ]
+    assert find_overlaps(touching) == []
+    zero = Shift(datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 10), key="zero")
+    at_start = Shift(datetime(2024, 1, 1, 8), datetime(2024, 1, 1, 8), key="start")
+    assert find_overlaps(touching + [zero, at_start]) == [(touching[0], zero)]
+    with pytest.raises(ValueError):
+        Shift(datetime(2024, 1, 2), datetime(2024, 1, 1))
+
+
+def test_shift_schedule():
+    rnd = random.Random(24)
+    shifts = [Shift(*_random_shift(rnd, 30 * 60), key=i) for i in range(200)]
+    schedule = ShiftSchedule(shifts[:100])
+    for shift in shifts[100:]:
+        schedule.add(shift)
+    assert len(schedule) == 200
+    ordered = list(schedule)
+    assert ordered == sorted(shifts, key=lambda shift: (shift.start, shift.end))
+    for _ in range(50):
+        dfrom, dto = _random_shift(rnd, 24 * 60)
+        expected = [s for s in ordered if do_overlap(s.start, s.end, dfrom, dto)]
+        assert schedule.overlapping(dfrom, dto) == expected
+    assert len(schedule.overlaps()) == len(find_overlaps(shifts))
+    day = night = 0
+    for shift in shifts:
+        shift_day, shift_night = _brute_day_night_minutes(shift.start, shift.end)
+        day += shift_day
+        night += shift_night
+    assert schedule.day_night_hours() == DayNightHours(
+        round(day / 60, 1), round(night / 60, 1)
+    )
+
+
+def test_daynight_hours_many():
+    np = pytest.importorskip("numpy")
+    rnd = random.Random(25)
+    shifts = [_random_shift(rnd, 3 * 24 * 60) for _ in range(2000)]
+    starts = np.array([start for start, _ in shifts], dtype="datetime64[m]")
+    ends = np.array([end for _, end in shifts], dtype="datetime64[m]")
+    hours = daynight_hours_many(starts, ends)
+    assert len(hours) == 2000
+    for i, (start, end) in enumerate(shifts):
+        assert hours[i] == daynight_hours(start, end)
+    expected = [daynight_hours(start, end).total_hours for start, end in shifts]
+    assert hours.total_hours.tolist() == expected
+
+
+def test_daynight_hours_many_rounding_and_nat():
+    np = pytest.importorskip("numpy")
+    start = np.datetime64("2024-01-01T08:00")
+    minutes = np.arange(0, 24 * 60)
+    ends = start + minutes.astype("timedelta64[m]")
+    hours = daynight_hours_many(np.full(minutes.shape, start), ends)
+    for minute, end in zip(minutes.tolist(), ends.tolist()):
+        assert hours[minute] == daynight_hours(datetime(2024, 1, 1, 8), end)
+    seconds = np.array(["2024-01-01T05:59:30", "2024-01-01T21:31:10"], "datetime64[s]")
+    seconds_end = np.array(
+        ["2024-01-01T06:00:30", "2024-01-03T07:31:05"], "datetime64[s]"
+    )
+    hours = daynight_hours_many(seconds, seconds_end)
+    for i, (start, end) in enumerate(zip(seconds.tolist(), seconds_end.tolist())):
+        assert hours[i] == daynight_hours(start, end)
+    hours = daynight_hours_many(
+        np.array(["2024-01-01T22:00:30", "NaT"], dtype="datetime64[s]"),
+        np.array(["2024-01-02T06:00", "2024-01-02T06:00"], dtype="datetime64[m]"),
+    )
+    assert hours[0] == DayNightHours(day_hours=0.0, night_hours=8.0)
+    assert np.isnan(hours.day_hours[1]) and np.isnan(hours.night_hours[1])
+    with pytest.raises(ValueError, match="row 1"):
+        daynight_hours_many(
+            ["2024-01-01T08:00", "2024-01-02T08:00"],
+            ["2024-01-01T16:00", "2024-01-01T16:00"],
+        )
+
+
+def _brute_buckets(dfrom, dto, night, overtime_after, extra=()):
+    """Minute by minute [day, night, Sunday, holiday, overtime...] minutes"""
+    minutes = [0] * (4 + len(overtime_after))
+    moment = dfrom
+    worked = 0
+    while moment < dto:
+        minute_of_day = moment.hour * 60 + moment.minute
+        minutes[1 if night(minute_of_day) else 0] += 1
+        minutes[2] += moment.weekday() == 6
+        minutes[3] += is_holiday(moment) or moment.date() in extra
+        for tier, low in enumerate(overtime_after):
+            high = overtime_after[tier + 1] if tier + 1 < len(overtime_after) else None
+            minutes[4 + tier] += worked >= low * 60 and (
+                high is None or worked < high * 60
+            )
+        worked += 1
+        moment += timedelta(minutes=1)
+    return minutes
+
+
+def _hours(minutes):
+    day, night, sunday, holiday, *overtime = [round(m / 60, 1) for m in minutes]
+    return HourBuckets(day, night, sunday, holiday, tuple(overtime))
+
+
+def test_shift_classifier_default():
+    classifier = ShiftClassifier()
+    rnd = random.Random(26)
+    shifts = [_random_shift(rnd, 2 * 24 * 60) for _ in range(100)]
+    totals = [0] * 5
+    for dfrom, dto in shifts:
+        expected = _brute_buckets(dfrom, dto, lambda m: m < 360 or m >= 1320, (8,))
+        totals = [total + m for total, m in zip(totals, expected)]
+        hours = classifier.classify(dfrom, dto)
+        assert hours == _hours(expected)
+        assert DayNightHours(hours.day_hours, hours.night_hours) == (
+            daynight_hours(dfrom, dto)
+        )
+    assert classifier.classify_many(shifts) == _hours(totals)
+    hours = classifier.classify(datetime(2024, 5, 5, 20), datetime(2024, 5, 6, 7))
+    assert hours == HourBuckets(3.0, 8.0, 4.0, 11.0, (3.0,))
+
+
+def test_shift_classifier_configured():
+    extra = {date(2024, 1, 3)}
+    classifier = ShiftClassifier(
+        night_start=time(0, 0),
+        night_end=time(5, 30),
+        overtime_after=(8, 9.5),
+        extra_holidays=extra,
+    )
+    rnd = random.Random(27)
+    for _ in range(100):
+        dfrom, dto = _random_shift(rnd, 30 * 60)
+        expected = _brute_buckets(dfrom, dto, lambda m: m < 330, (8, 9.5), extra)
+        assert classifier.classify(dfrom, dto) == _hours(expected)
+    hours = classifier.classify(datetime(2024, 1, 2, 20), datetime(2024, 1, 3, 8))
+    assert hours == HourBuckets(6.5, 5.5, 0.0, 8.0, (1.5, 2.5))
+
+
+def test_shift_classifier_errors():
+    with pytest.raises(ValueError):
+        ShiftClassifier(night_start=time(22), night_end=time(22))
+    with pytest.raises(ValueError):
+        ShiftClassifier(overtime_after=(9, 8))
+    with pytest.raises(ValueError):
+        ShiftClassifier().classify(datetime(2024, 1, 2), datetime(2024, 1, 1))
+
+
+def _random_trange(rnd):
+    day = date(2024, 1, 1) + timedelta(days=rnd.randrange(0, 366))
+    tfrom = f"{rnd.randrange(24):02d}:{rnd.choice((0, 15, 30, 45)):02d}"
+    tto = f"{rnd.randrange(24):02d}:{rnd.choice((0, 15, 30, 45)):02d}"
+    if rnd.random() < 0.5:
+        return f"{day.isoformat()}T{tfrom}T{tto}"
+    return f"{day.isoformat()} {tfrom} {tto}"
+
+
+def test_time_ranges_many():
+    np = pytest.importorskip("numpy")
+    rnd = random.Random(28)
+    tranges = [_random_trange(rnd) for _ in range(1000)]
+    tranges.append("2024-01-01T08:00:30T16:00:45")
+    starts, ends = time_ranges_many(np.array(tranges))
+    assert starts.dtype == np.dtype("datetime64[s]")
+    for trange, start, end in zip(tranges, starts.tolist(), ends.tolist()):
+        assert (start, end) == time_range(trange)
+    hours = day_night_hours_from_ranges(tranges)
+    for i, trange in enumerate(tranges):
+        assert hours[i] == daynight_hours(*time_range(trange))
+
+
+def test_time_ranges_many_errors():
+    np = pytest.importorskip("numpy")
+    tranges = [
+        "2024-01-01T08:00T16:00",
+        "2024-13-01T08:00T16:00",
+        "2024-01-01 25:00 16:00",
+        "2024-01-01",
+        "2024-01-01 08:00T16:00",
+        None,
+    ]
+    with pytest.raises(TimeRangeError) as error:
+        time_ranges_many(tranges)
+    assert error.value.row == 1
+    assert error.value.value == "2024-13-01T08:00T16:00"
+    starts, ends = time_ranges_many(tranges, errors="coerce")
+    assert np.isnat(starts).tolist() == [False] + [True] * 5
+    assert np.isnat(ends).tolist() == [False] + [True] * 5
+    hours = day_night_hours_from_ranges(tranges, errors="coerce")
+    assert hours[0] == DayNightHours(day_hours=8.0, night_hours=0.0)
+    assert np.isnan(hours.day_hours[1:]).all()
+    with pytest.raises(ValueError):
+        time_ranges_many(tranges, errors="ignore")
+
+
+def _brute_minutes(dfrom, dto):
+    if dto < dfrom:
+        dfrom, dto = dto, dfrom
+    minutes = 0
+    while dfrom + timedelta(minutes=minutes + 1) <= dto:
+        minutes += 1
+    return minutes
+
+
+def test_delta_hours_multi_day():
+    assert delta_hours(datetime(2024, 1, 1, 8), datetime(2024, 1, 2, 10)) == 26.0
+    assert delta_hours(datetime(2024, 1, 5), datetime(2024, 1, 1, 23, 30)) == 72.5
+    rnd = random.Random(29)
+    for _ in range(200):
+        dfrom = datetime(2024, 1, 1) + timedelta(seconds=rnd.randrange(0, 86400 * 30))
+        dto = dfrom + timedelta(seconds=rnd.randrange(-86400 * 3, 86400 * 3))
+        minutes = _brute_minutes(dfrom, dto)
+        assert delta_minutes(dfrom, dto) == minutes
+        assert delta_hours(dfrom, dto) == round(minutes / 60, 1)
+
+
+def test_daynight_hours_property():
+    rnd = random.Random(30)
+    for _ in range(300):
+        start = datetime(2024, 3, 1) + timedelta(minutes=rnd.randrange(0, 3 * 1440))
+        end = start + timedelta(minutes=rnd.randrange(0, 4 * 1440))
+        day, night = _brute_day_night_minutes(start, end)
+        expected = DayNightHours(round(day / 60, 1), round(night / 60, 1))
+        assert daynight_hours(start, end) == expected
+
+
+def test_delta_hours_many():
+    np = pytest.importorskip("numpy")
+    rnd = random.Random(31)
+    seconds = [rnd.randrange(-86400 * 5, 86400 * 5) for _ in range(2000)]
+    deltas = np.array(seconds, dtype="timedelta64[s]")
+    expected = [
+        delta_hours(datetime(2024, 1, 1), datetime(2024, 1, 1) + d)
+        for d in deltas.tolist()
+    ]
+    assert delta_hours_many(deltas).tolist() == expected
+    hours = delta_hours_many(np.array([90, "NaT"], dtype="timedelta64[m]"))
+    assert hours[0] == 1.5 and np.isnan(hours[1])
+    with pytest.raises(ValueError):
+        delta_hours_many(np.array([1.0]))
@@ -1,14 +1,23 @@
-from datetime import date
+from datetime import date, timedelta
 
 import pytest
 
 from utils.datetimes import (
+    DateConversionError,
+    GreekDateError,
     date2gr,
+    date2gr_many,
     gr2date,
+    gr2date_many,
     gr2iso,
+    gr2iso_many,
+    greek_date_mask,
     is_greek_date,
     iso2gr,
+    iso2gr_many,
     iso2yearmonth,
+    parse_gr_date,
+    read_date_column,
 )
 
 
@@ -81,7 +90,202 @@ def test_iso2yearmonth(isodate, expected_yearmonth):
         ("2024-06-15", False),
         ("1999-12-31", False),
         ("2000-01-01", False),
+        ("99/99/9999", False),
+        ("15/06/2024 and more", False),
     ],
 )
 def test_is_greek_date(date, expected_greek):
     assert is_greek_date(date) == expected_greek
+
+
+def _all_dates(start=date(1999, 1, 1), days=800):
+    return [start + timedelta(days=i) for i in range(days)]
+
+
+def test_batch_conversions_match_scalar():
+    dates = _all_dates()
+    gr_dates = [date2gr(d) for d in dates]
+    iso_dates = [d.isoformat() for d in dates]
+    assert date2gr_many(dates) == gr_dates
+    assert gr2date_many(gr_dates) == [gr2date(d) for d in gr_dates]
+    assert gr2iso_many(gr_dates) == [gr2iso(d) for d in gr_dates]
+    assert iso2gr_many(iso_dates) == [iso2gr(d) for d in iso_dates]
+    assert gr2date_many(gr_dates * 2, memoize=False) == dates * 2
+
+
+INVALID_GR_DATES = [
+    "31/02/2024",
+    "29/02/2023",
+    "00/01/2024",
+    "15/13/2024",
+    "99/99/9999",
+    "1/6/2024",
+    "15-06-2024",
+    "15/06/2024 ",
+    "15/06/24",
+    "١٥/٠٦/٢٠٢٤",
+    "",
+    None,
+]
+
+
+@pytest.mark.parametrize("value", INVALID_GR_DATES)
+def test_gr2date_many_invalid(value):
+    with pytest.raises(DateConversionError) as exc_info:
+        gr2date_many(["15/06/2024", value])
+    assert exc_info.value.row == 1
+    assert exc_info.value.value == value
+    assert gr2date_many(["15/06/2024", value], errors="coerce") == [
+        date(2024, 6, 15),
+        None,
+    ]
+    with pytest.raises(DateConversionError):
+        gr2iso_many([value])
+
+
+@pytest.mark.parametrize(
+    "value", ["2023-02-29", "2024-6-15", "2024/06/15", "15/06/2024", "2024-06-15T"]
+)
+def test_iso2gr_many_invalid(value):
+    with pytest.raises(DateConversionError) as exc_info:
+        iso2gr_many(["2024-06-15", "2024-06-16", value])
+    assert exc_info.value.row == 2
+    assert iso2gr_many([value], errors="coerce") == [None]
+
+
+def test_batch_conversions_errors_argument():
+    with pytest.raises(ValueError):
+        gr2date_many(["15/06/2024"], errors="ignore")
+    with pytest.raises(DateConversionError):
+        date2gr_many([date(2024, 1, 1), "2024-01-01"])
+
+
+def test_batch_conversions_numpy():
+    np = pytest.importorskip("numpy")
+    gr_dates = np.array(["15/06/2024", "29/02/2024", "bad", "15/06/2024"])
+    result = gr2date_many(gr_dates, errors="coerce", as_datetime64=True)
+    assert result.dtype == np.dtype("datetime64[D]")
+    assert result[:2].tolist() == [date(2024, 6, 15), date(2024, 2, 29)]
+    assert np.isnat(result[2])
+    assert date2gr_many(result, errors="coerce") == [
+        "15/06/2024",
+        "29/02/2024",
+        None,
+        "15/06/2024",
+    ]
+    assert iso2gr_many(np.array(["2024-06-15"])) == ["15/06/2024"]
+
+
+def test_batch_conversions_numpy_2d():
+    np = pytest.importorskip("numpy")
+    gr_dates = np.array([["15/06/2024", "29/02/2024"], ["bad", "01/01/2000"]])
+    assert gr2iso_many(gr_dates, errors="coerce") == [
+        "2024-06-15",
+        "2024-02-29",
+        None,
+        "2000-01-01",
+    ]
+    result = gr2date_many(gr_dates, errors="coerce", as_datetime64=True)
+    assert result.shape == (2, 2)
+    assert result[0].tolist() == [date(2024, 6, 15), date(2024, 2, 29)]
+    assert date2gr_many(result, errors="coerce")[2:] == [None, "01/01/2000"]
+    with pytest.raises(DateConversionError) as exc_info:
+        gr2date_many(gr_dates)
+    assert exc_info.value.row == 2
+
+
+@pytest.mark.parametrize(
+    "value,reason,position",
+    [
+        (None, "not a string", None),
+        ("1/6/2024", "wrong length", None),
+        ("15/06/2024x", "wrong length", None),
+        ("15-06-2024", "wrong separator", 2),
+        ("15/06-2024", "wrong separator", 5),
+        ("15/0a/2024", "not a digit", 4),
+        ("15/06/２０24", "not a digit", 6),
+        ("15/06/0000", "invalid year", 6),
+        ("15/13/2024", "invalid month", 3),
+        ("99/99/9999", "invalid month", 3),
+        ("29/02/2023", "invalid day", 0),
+        ("29/02/1900", "invalid day", 0),
+        ("31/04/2024", "invalid day", 0),
+        ("00/01/2024", "invalid day", 0),
+    ],
+)
+def test_parse_gr_date_errors(value, reason, position):
+    error = parse_gr_date(value)
+    assert error == GreekDateError(value, reason, position)
+    assert reason in str(error)
+    assert is_greek_date(value) is False
+
+
+def test_parse_gr_date_matches_gr2date():
+    for day in _all_dates(date(1896, 1, 1), 366 * 8):
+        gr_date = date2gr(day)
+        assert parse_gr_date(gr_date) == gr2date(gr_date) == day
+    assert parse_gr_date("29/02/2000") == date(2000, 2, 29)
+
+
+def test_greek_date_mask():
+    values = ["15/06/2024", "99/99/9999", "15/06/2024 trailing", "29/02/2024"]
+    assert greek_date_mask(values) == [True, False, False, True]
+    np = pytest.importorskip("numpy")
+    mask = greek_date_mask(np.array(values).reshape(2, 2))
+    assert mask.dtype == np.bool_
+    assert mask.tolist() == [[True, False], [False, True]]
+
+
+def _write_records(path, dates, fmt, terminator="\n", last_terminator=True):
+    lines = [
+        f"ID{i:05d} {fmt(d) if isinstance(d, date) else d} Χ"
+        for i, d in enumerate(dates)
+    ]
+    content = terminator.join(lines) + (terminator if last_terminator else "")
+    path.write_bytes(content.encode("utf-8"))
+
+
+def test_read_date_column_matches_gr2date(tmp_path):
+    np = pytest.importorskip("numpy")
+    dates = _all_dates(date(1999, 12, 1), 500)
+    path = tmp_path / "records.txt"
+    _write_records(path, dates, date2gr)
+    result = read_date_column(path, offset=8, block_size=77)
+    assert result.dtype == np.dtype("datetime64[D]")
+    assert result.tolist() == [gr2date(date2gr(d)) for d in dates]
+
+
+@pytest.mark.parametrize("last_terminator", [True, False])
+def test_read_date_column_iso(tmp_path, last_terminator):
+    pytest.importorskip("numpy")
+    dates = _all_dates(date(2024, 2, 20), 20)
+    path = tmp_path / "records.txt"
+    path.write_bytes(b"HEADER\r\n")
+    with open(path, "ab") as file:
+        lines = [f"{d.isoformat()}|{i:03d}" for i, d in enumerate(dates)]
+        content = "\r\n".join(lines) + ("\r\n" if last_terminator else "")
+        file.write(content.encode("ascii"))
+    result = read_date_column(
+        path, offset=0, record_length=16, date_format="iso", header_bytes=8
+    )
+    assert result.tolist() == dates
+
+
+def test_read_date_column_invalid(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "records.txt"
+    _write_records(
+        path, [date(2024, 1, 1), "29/02/2023", "99/99/9999", "1x/01/2024"], date2gr
+    )
+    with pytest.raises(DateConversionError) as exc_info:
+        read_date_column(path, offset=8)
+    assert exc_info.value.row == 1
+    assert exc_info.value.value == "29/02/2023"
+    result = read_date_column(path, offset=8, errors="coerce")
+    assert result[0] == np.datetime64("2024-01-01")
+    assert np.isnat(result[1:]).all()
+    with pytest.raises(ValueError):
+        read_date_column(path, offset=30)
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert read_date_column(empty, offset=0, record_length=11).size == 0
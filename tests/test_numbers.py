@@ -1,6 +1,23 @@
+import random
+from decimal import Decimal
+
 import pytest
 
-from utils.numbers import float2gr, gr2float
+from utils.numbers import (
+    NumberConversionError,
+    cents2gr,
+    cents2gr_many,
+    float2gr,
+    float2gr_empty_zero,
+    float2gr_many,
+    gr2cents,
+    gr2cents_many,
+    gr2decimal,
+    gr2decimal_many,
+    gr2float,
+    gr2float_many,
+    is_greek_number,
+)
 
 
 @pytest.mark.parametrize(
@@ -29,3 +46,241 @@ def test_gr2float(gr_number_str, expected_float):
 )
 def test_float2gr(number, expected_gr_str):
     assert float2gr(number) == expected_gr_str
+
+
+VALID_NUMBERS = [
+    "1.234,56",
+    "-1.234,56",
+    "+1.234,564",
+    "12.345.678,90",
+    "0,99",
+    "1234,5",
+    "123.456",
+    "7",
+    "0,1000000000000000055511151231257827",
+    "123.456.789.012.345.678,123",
+    "-0",
+]
+
+INVALID_NUMBERS = [
+    "1.2.3,4",
+    "12.34,5",
+    "1234.567",
+    ".123",
+    "1.23",
+    "1,",
+    ",5",
+    "1,2,3",
+    "-",
+    "",
+    " 1",
+    "1e5",
+    "nan",
+    "١٢",
+    "1.234,5x",
+]
+
+
+@pytest.mark.parametrize("value", VALID_NUMBERS)
+def test_is_greek_number_valid(value):
+    assert is_greek_number(value)
+    assert gr2decimal(value) == Decimal(value.replace(".", "").replace(",", "."))
+
+
+@pytest.mark.parametrize("value", INVALID_NUMBERS + [None, 12])
+def test_is_greek_number_invalid(value):
+    assert not is_greek_number(value)
+    with pytest.raises(ValueError):
+        gr2decimal(value)
+
+
+def test_gr2decimal_many():
+    assert gr2decimal_many(["1.234,56", "0,10"]) == [
+        Decimal("1234.56"),
+        Decimal("0.10"),
+    ]
+    assert gr2decimal_many(["1", "1.2.3"], errors="coerce") == [Decimal(1), None]
+    with pytest.raises(NumberConversionError) as exc_info:
+        gr2decimal_many(["1", "2", "1.2.3"])
+    assert exc_info.value.row == 2
+
+
+def test_gr2float_many_matches_gr2float():
+    np = pytest.importorskip("numpy")
+    rnd = random.Random(0)
+    values = VALID_NUMBERS + [
+        float2gr(rnd.uniform(-1e9, 1e9), rnd.randint(0, 6)) for _ in range(2000)
+    ]
+    result = gr2float_many(values)
+    assert result.dtype == np.float64
+    assert result.tolist() == [gr2float(value) for value in values]
+    string_dtype = np.array(values, dtype=np.dtypes.StringDType())
+    assert gr2float_many(string_dtype).tolist() == result.tolist()
+
+
+def test_gr2float_many_invalid():
+    np = pytest.importorskip("numpy")
+    values = VALID_NUMBERS + INVALID_NUMBERS
+    result = gr2float_many(values, errors="coerce")
+    assert not np.isnan(result[: len(VALID_NUMBERS)]).any()
+    assert np.isnan(result[len(VALID_NUMBERS) :]).all()
+    for value in INVALID_NUMBERS + [None]:
+        with pytest.raises(NumberConversionError) as exc_info:
+            gr2float_many(["1,5", value])
+        assert exc_info.value.row == 1
+        assert exc_info.value.value == value
+    with pytest.raises(ValueError):
+        gr2float_many(["1"], errors="ignore")
+
+
+def test_gr2float_many_shape():
+    np = pytest.importorskip("numpy")
+    values = np.array([["1,5", "2.000"], ["-3", "4,25"]])
+    assert gr2float_many(values).tolist() == [[1.5, 2000.0], [-3.0, 4.25]]
+    assert gr2float_many([]).shape == (0,)
+
+
+def test_gr2float_many_blocks_and_long_cells():
+    np = pytest.importorskip("numpy")
+    long_number = "1" + ".000" * 20 + ",5"
+    values = ["1,5", long_number, "x" * 500, "-2", "9" * 40000, "3.000"]
+    expected = [gr2float(v) if is_greek_number(v) else None for v in values]
+    for block_size in (1, 2, 4, 100):
+        result = gr2float_many(values, errors="coerce", block_size=block_size)
+        assert [None if np.isnan(r) else r for r in result.tolist()] == expected
+        string_dtype = np.array(values, dtype=np.dtypes.StringDType())
+        result = gr2float_many(string_dtype, errors="coerce", block_size=block_size)
+        assert [None if np.isnan(r) else r for r in result.tolist()] == expected
+    with pytest.raises(NumberConversionError) as exc_info:
+        gr2float_many(values, block_size=2)
+    assert exc_info.value.row == 2
+    with pytest.raises(ValueError):
+        gr2float_many(values, block_size=0)
+
+
+@pytest.mark.parametrize(
+    "gr_number_str,cents",
+    [
+        ("1.234,56", 123456),
+        ("-1.234,56", -123456),
+        ("+0,05", 5),
+        ("-0,05", -5),
+        ("12.345.678,9", 1234567890),
+        ("7", 700),
+        ("1,500", 150),
+        ("92.233.720.368.547.758,07", 2**63 - 1),
+    ],
+)
+def test_gr2cents(gr_number_str, cents):
+    assert gr2cents(gr_number_str) == cents
+
+
+@pytest.mark.parametrize("value", ["1,234", "1.2.3", "abc", "0,001"])
+def test_gr2cents_invalid(value):
+    with pytest.raises(ValueError):
+        gr2cents(value)
+
+
+@pytest.mark.parametrize(
+    "cents,expected",
+    [
+        (123456, "1.234,56"),
+        (-123456, "-1.234,56"),
+        (-5, "-0,05"),
+        (0, "0,00"),
+        (1234567890, "12.345.678,90"),
+    ],
+)
+def test_cents2gr(cents, expected):
+    assert cents2gr(cents) == expected
+    assert gr2cents(expected) == cents
+
+
+def test_cents_round_trip_matches_float2gr():
+    rnd = random.Random(1)
+    cents = [rnd.randint(-(10**11), 10**11) for _ in range(2000)]
+    texts = cents2gr_many(cents)
+    assert texts == [float2gr(c / 100) for c in cents]
+    np = pytest.importorskip("numpy")
+    array = gr2cents_many(np.array(texts))
+    assert array.dtype == np.int64
+    assert array.tolist() == cents
+    assert cents2gr_many(array) == texts
+    assert array.sum() == sum(cents)
+
+
+def test_gr2cents_many():
+    pytest.importorskip("numpy")
+    values = ["1.234,56", "-1.234,56", "+0,05", "-0,05", "12.345.678,9", "7"]
+    values += ["1,500", "92.233.720.368.547.758,07", "1" + ".000" * 20 + ",00"]
+    expected = [gr2cents(value) for value in values]
+    expected[-1] = None
+    for block_size in (1, 2, 4, 100):
+        cents = gr2cents_many(values, errors="coerce", block_size=block_size)
+        assert cents.filled(-1).tolist() == [-1 if c is None else c for c in expected]
+    assert gr2cents_many(values[:-1], block_size=3).tolist() == expected[:-1]
+    long_amount = "0" * 100 + "1,00"
+    assert gr2cents_many(["2,00", long_amount], block_size=1).tolist() == [200, 100]
+    with pytest.raises(NumberConversionError) as exc_info:
+        gr2cents_many(["1,00"] * 5 + ["9" * 40000], block_size=2)
+    assert exc_info.value.row == 5
+
+
+@pytest.mark.parametrize(
+    "value", ["1,234", "1.2.3", "92.233.720.368.547.758,08", "9" * 30, None]
+)
+def test_gr2cents_many_invalid(value):
+    pytest.importorskip("numpy")
+    with pytest.raises(NumberConversionError) as exc_info:
+        gr2cents_many(["1,00", "2,00", value])
+    assert exc_info.value.row == 2
+    assert exc_info.value.value == value
+    cents = gr2cents_many(["1,00", value, "2,00"], errors="coerce")
+    assert cents.mask.tolist() == [False, True, False]
+    assert cents.filled(-1).tolist() == [100, -1, 200]
+
+
+def test_gr2cents_many_coerce():
+    np = pytest.importorskip("numpy")
+    values = np.array(
+        [
+            ["1.234,56", "abc"],
+            ["12.345.678.901.234.567,89", "99.999.999.999.999.999,99"],
+        ]
+    )
+    cents = gr2cents_many(values, errors="coerce")
+    assert cents.dtype == np.int64
+    assert cents.mask.tolist() == [[False, True], [False, True]]
+    assert cents.filled(0).tolist() == [[123456, 0], [1234567890123456789, 0]]
+    assert not gr2cents_many(["5,00"], errors="coerce").mask.any()
+    assert gr2cents_many([], errors="coerce").shape == (0,)
+    with pytest.raises(ValueError):
+        gr2cents_many(["1,00"], errors="ignore")
+
+
+@pytest.mark.parametrize("decimals", [0, 2, 3])
+def test_float2gr_many(decimals):
+    rnd = random.Random(2)
+    numbers = [0, 0.0, -0.0, 1234.56, -1234.56, 1e15] + [
+        rnd.uniform(-1e7, 1e7) for _ in range(500)
+    ]
+    assert float2gr_many(numbers, decimals) == [
+        float2gr(number, decimals) for number in numbers
+    ]
+    assert float2gr_many(numbers, decimals, empty_zero=True) == [
+        float2gr_empty_zero(number, decimals) for number in numbers
+    ]
+    assert float2gr_many([]) == []
+
+
+def test_float2gr_many_numpy():
+    np = pytest.importorskip("numpy")
+    numbers = np.array([[1234.56, 0], [-0.99, 12345678.9]])
+    assert float2gr_many(numbers) == ["1.234,56", "0,00", "-0,99", "12.345.678,90"]
+    assert float2gr_many(numbers, empty_zero=True)[1] == ""
+
+
+def test_float2gr_many_random_values():
+    numbers = [random.uniform(-1e7, 1e7) for _ in range(20_000)]
+    expected = [float2gr_empty_zero(number) for number in numbers]
+    assert float2gr_many(numbers, empty_zero=True) == expected
@@ -1,6 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from utils.texts import are_texts_equal, grup
+from utils.texts import (
+    GRUP_CACHE,
+    GRUP_TABLE,
+    GrupCache,
+    GrupCacheStats,
+    TextIndex,
+    _grup_normalize,
+    are_texts_equal,
+    cached_grup,
+    grup,
+    grup_array,
+    grup_many,
+    iter_grup,
+    levenshtein,
+)
 
 
 @pytest.mark.parametrize(
@@ -56,3 +72,215 @@ def test_grup_special_characters():
 )
 def test_is_text_same(text1, text2, expected):
     assert are_texts_equal(text1, text2) == expected
+
+
+def _bmp_chars():
+    return (chr(cp) for cp in range(0x10000) if not 0xD800 <= cp <= 0xDFFF)
+
+
+def test_grup_table_matches_reference_over_bmp():
+    for char in _bmp_chars():
+        assert grup(char) == _grup_normalize(char), hex(ord(char))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Ϋ́ Ϊ́ ΐΰ",
+        "ὈΔΥΣΣΕΎΣ ᾅδης ᾠδή",
+        "Ελληνικά και English ßtraße",
+        "Καφές ☕ με 中文",  # characters outside the table
+        "ᾴ̈",
+        "ἀρχή\U0001d165́",
+    ],
+)
+def test_grup_mixed_strings_match_reference(text):
+    assert grup(text) == _grup_normalize(text)
+
+
+def test_grup_whole_table_matches_reference():
+    text = "".join(chr(cp) for cp in GRUP_TABLE)
+    assert grup(text) == _grup_normalize(text)
+
+
+def test_grup_cache_hits_and_misses():
+    cache = GrupCache(max_entries=10)
+    assert cache("Καλημέρα") == "ΚΑΛΗΜΕΡΑ"
+    assert cache("Καλημέρα") == "ΚΑΛΗΜΕΡΑ"
+    assert cache("Ώρα") == "ΩΡΑ"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+    assert stats.memory_bytes > 0
+
+
+def test_grup_cache_evicts_least_recently_used():
+    cache = GrupCache(max_entries=2)
+    cache("α")
+    cache("β")
+    cache("α")
+    cache("γ")  # evicts "β"
+    assert cache.stats().evictions == 1
+    cache("α")
+    assert cache.stats().hits == 2
+    cache("β")
+    assert cache.stats().misses == 4
+    assert len(cache) == 2
+
+
+def test_grup_cache_bypasses_long_texts():
+    cache = GrupCache(max_length=5)
+    assert cache("Καλημέρα") == "ΚΑΛΗΜΕΡΑ"
+    stats = cache.stats()
+    assert (stats.bypassed, stats.entries, stats.misses) == (1, 0, 0)
+
+
+def test_grup_cache_clear():
+    cache = GrupCache()
+    cache("Καλημέρα")
+    cache("Καλημέρα")
+    cache.clear()
+    assert cache.stats() == GrupCacheStats(0, 0, 0, 0, 0, cache.stats().memory_bytes)
+    assert len(cache) == 0
+
+
+def test_grup_cache_invalid_size():
+    with pytest.raises(ValueError):
+        GrupCache(max_entries=0)
+
+
+def test_are_texts_equal_cache_is_opt_in():
+    GRUP_CACHE.clear()
+    assert are_texts_equal("Καλημέρα", "καλημερα")
+    assert len(GRUP_CACHE) == 0
+    are_texts_equal("Καλημέρα", "καλημερα", cache=GRUP_CACHE)
+    are_texts_equal("Καλημέρα", "καλημερα", cache=GRUP_CACHE)
+    assert GRUP_CACHE.stats().hits == 2
+    assert cached_grup("Καλημέρα") == "ΚΑΛΗΜΕΡΑ"
+
+
+def test_grup_cache_threads():
+    cache = GrupCache(max_entries=8)
+    texts = [f"Κείμενο {i % 20}" for i in range(2000)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(cache, texts))
+    assert results == [grup(text) for text in texts]
+    stats = cache.stats()
+    assert stats.hits + stats.misses == len(texts)
+    assert len(cache) <= 8
+
+
+def test_grup_many():
+    texts = ["Καλημέρα", "Ώρα", "Καλημέρα", "straße"]
+    assert grup_many(texts) == [grup(text) for text in texts]
+    assert grup_many(iter(texts)) == ["ΚΑΛΗΜΕΡΑ", "ΩΡΑ", "ΚΑΛΗΜΕΡΑ", "STRASSE"]
+    assert grup_many([]) == []
+
+
+def test_iter_grup():
+    cache = GrupCache()
+    texts = (text for text in ["Καλημέρα", "Ώρα", "Καλημέρα"])
+    assert list(iter_grup(texts, cache)) == ["ΚΑΛΗΜΕΡΑ", "ΩΡΑ", "ΚΑΛΗΜΕΡΑ"]
+    assert cache.stats().hits == 1
+    assert list(iter_grup(["ΰ"])) == ["Υ"]
+
+
+def test_grup_array():
+    np = pytest.importorskip("numpy")
+    texts = np.array([["Καλημέρα", "straße"], ["Ώρα", "Καλημέρα"]])
+    result = grup_array(texts)
+    assert result.shape == (2, 2)
+    assert result.tolist() == [["ΚΑΛΗΜΕΡΑ", "STRASSE"], ["ΩΡΑ", "ΚΑΛΗΜΕΡΑ"]]
+    assert grup_array(np.array([], dtype=str)).size == 0
+
+
+def test_grup_array_string_dtype():
+    np = pytest.importorskip("numpy")
+    texts = np.array(["Ϋ́ Ϊ́", "Δοϊράνη", "Ϋ́ Ϊ́"], dtype=np.dtypes.StringDType())
+    result = grup_array(texts)
+    assert isinstance(result.dtype, np.dtypes.StringDType)
+    assert result.tolist() == ["Υ Ι", "ΔΟΙΡΑΝΗ", "Υ Ι"]
+
+
+@pytest.mark.parametrize(
+    "text1,text2,expected",
+    [
+        ("", "", 0),
+        ("abc", "", 3),
+        ("kitten", "sitting", 3),
+        ("ΠΑΠΑΔΟΠΟΥΛΟΣ", "ΠΑΠΑΔΟΠΟΛΟΣ", 1),
+    ],
+)
+def test_levenshtein(text1, text2, expected):
+    assert levenshtein(text1, text2) == expected
+    assert levenshtein(text2, text1) == expected
+    assert levenshtein(text1, text2, max_distance=0) == min(expected, 1)
+
+
+NAMES = [
+    "Παπαδόπουλος",
+    "Παπαδοπούλου",
+    "Γεωργίου",
+    "Γεωργιου",
+    "Νικολάου",
+    "Ιωάννου",
+    "Αλ",
+]
+
+
+def test_text_index_find_equal():
+    index = TextIndex(NAMES)
+    assert index.find_equal("ΓΕΩΡΓΙΟΥ") == ["Γεωργίου", "Γεωργιου"]
+    assert index.find_equal("Άγνωστος") == []
+    assert "παπαδοπουλος" in index
+    assert len(index) == len(NAMES)
+
+
+def test_text_index_find_similar():
+    index = TextIndex(NAMES)
+    assert index.find_similar("Παπαδοπουλος", max_distance=0) == [("Παπαδόπουλος", 0)]
+    assert index.find_similar("Παπαδόπουλοσ", max_distance=0) == [("Παπαδόπουλος", 0)]
+    assert index.find_similar("Παπαδοπουλο") == [
+        ("Παπαδόπουλος", 1),
+        ("Παπαδοπούλου", 1),
+    ]
+    assert index.find_similar("Ιωανου") == [("Ιωάννου", 1)]
+    assert index.find_similar("Α", max_distance=1) == [("Αλ", 1)]
+
+
+def test_text_index_matches_brute_force():
+    index = TextIndex(NAMES, ngram=2)
+    for query in ["Παπαδ", "Γιωργιου", "Νικολαος", "Ιωαννης", ""]:
+        for max_distance in range(4):
+            expected = sorted(
+                (levenshtein(grup(query), grup(name)), name)
+                for name in NAMES
+                if levenshtein(grup(query), grup(name)) <= max_distance
+            )
+            found = index.find_similar(query, max_distance)
+            assert sorted((d, v) for v, d in found) == expected
+
+
+def test_text_index_add_remove():
+    index = TextIndex()
+    first = index.add("Νικολάου", value=1)
+    second = index.add("Νικολαου", value=2)
+    assert index.find_equal("νικολαου") == [1, 2]
+    index.remove(first)
+    assert index.find_equal("νικολαου") == [2]
+    assert index.find_similar("Νικολαος") == [(2, 1)]
+    index.remove(second)
+    assert index.find_similar("Νικολαος") == []
+    stats = index.stats()
+    assert (stats.entries, stats.distinct_keys, stats.ngrams) == (0, 0, 0)
+    with pytest.raises(KeyError):
+        index.remove(first)
+
+
+def test_text_index_stats():
+    index = TextIndex(NAMES)
+    stats = index.stats()
+    assert stats.entries == len(NAMES)
+    assert stats.distinct_keys == len(NAMES) - 1
+    assert stats.build_seconds > 0
+    assert stats.memory_bytes > 0
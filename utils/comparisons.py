@@ -1,3 +1,20 @@
+import multiprocessing
+import operator as op
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+
+from utils.texts import cached_grup, grup, grup_array
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
 # Dictionary mapping operators to their comparison functions
 OPERATORS = {
     "=": lambda a, b: a == b,
@@ -16,6 +33,34 @@ OPERATORS = {
     "not_contains": lambda a, b: b not in a,
     "startsWith": lambda a, b: a.startswith(b),
     "endsWith": lambda a, b: a.endswith(b),
+    # Accent and case insensitive variants, comparing grup normalized texts
+    "eq_gr": lambda a, b: cached_grup(a) == cached_grup(b),
+    "ne_gr": lambda a, b: cached_grup(a) != cached_grup(b),
+    "contains_gr": lambda a, b: cached_grup(b) in cached_grup(a),
+    "not_contains_gr": lambda a, b: cached_grup(b) not in cached_grup(a),
+    "startsWith_gr": lambda a, b: cached_grup(a).startswith(cached_grup(b)),
+    "endsWith_gr": lambda a, b: cached_grup(a).endswith(cached_grup(b)),
+}
+
+# Greek operators and the operator they apply to the normalized texts
+GREEK_OPERATORS = {
+    "eq_gr": "=",
+    "ne_gr": "!=",
+    "contains_gr": "contains",
+    "not_contains_gr": "not_contains",
+    "startsWith_gr": "startsWith",
+    "endsWith_gr": "endsWith",
+}
+
+
+# Set based equivalents of the collection operators, used when the criterion is hashable
+SET_OPERATORS = {
+    "in": lambda a, members: a in members,
+    "not_in": lambda a, members: a not in members,
+    "anyInList": lambda a, members: not members.isdisjoint(a),
+    "allInList": lambda a, members: members.issuperset(a),
+    "not_anyInList": lambda a, members: members.isdisjoint(a),
+    "not_allInList": lambda a, members: not members.issuperset(a),
 }
 
 
@@ -47,14 +92,636 @@ def is_match(attributes: dict, class_instance: object) -> bool:
     return True
 
 
-def find(*, search_attributes: dict, class_: type, class_instances: list) -> list:
+def find(
+    *,
+    search_attributes: dict,
+    class_: type,
+    class_instances: list,
+    adaptive: bool = False,
+) -> list:
     """Find all class instances that match the given attribute conditions.
     parameters:
         search_attributes: A dictionary where keys are attribute names and values are tuples of (operator, value).
         class_: The class type of the instances to be searched.
         class_instances: A list of class instances to search through.
+        adaptive: Reorder the conditions while scanning so that cheap and selective ones run first (see AdaptiveQuery).
     returns: A list of class instances that match all the specified attribute conditions.
     """
+    if adaptive:
+        predicate = AdaptiveQuery(search_attributes, class_)
+    else:
+        predicate = compile_query(search_attributes, class_)
+    return [obj for obj in class_instances if predicate(obj)]
+
+
+def iter_find(
+    *, search_attributes: dict, class_: type, class_instances: Iterable
+) -> Iterator:
+    """Lazy find: yields the matching instances of any iterable, without materializing it."""
+    predicate = compile_query(search_attributes, class_)
+    return filter(predicate, class_instances)
+
+
+def _find_chunk_indices(search_attributes: dict, class_: type, chunk: list) -> list:
+    """Process pool worker: positions of the matching instances in chunk"""
+    predicate = compile_query(search_attributes, class_)
+    return [i for i, obj in enumerate(chunk) if predicate(obj)]
+
+
+def find_parallel(
+    *,
+    search_attributes: dict,
+    class_: type,
+    class_instances: list,
+    chunk_size: int = 50_000,
+    workers: int | None = None,
+) -> list:
+    """find over chunks of class_instances in a process pool, results in input order.
+
+    The instances are pickled to spawned workers, so class_ must be importable
+    (defined at module level). Only the positions of the matches come back,
+    the returned objects are the original instances.
+    parameters:
+        chunk_size: Number of instances sent to a worker at once.
+        workers: Number of worker processes, os.cpu_count() by default.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive: {chunk_size}")
     if not has_attributes(list(search_attributes.keys()), class_):
         return []
-    return [obj for obj in class_instances if is_match(search_attributes, obj)]
+    for operator, _ in search_attributes.values():
+        if operator not in OPERATORS:
+            raise ValueError(f"Unsupported operator: {operator}")
+    chunks = [
+        class_instances[i : i + chunk_size]
+        for i in range(0, len(class_instances), chunk_size)
+    ]
+    if len(chunks) <= 1 or workers == 1:
+        return find(
+            search_attributes=search_attributes,
+            class_=class_,
+            class_instances=class_instances,
+        )
+    result = []
+    # spawn: forking a multi-threaded parent (e.g. with numpy loaded) may deadlock
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        chunk_matches = executor.map(
+            _find_chunk_indices, repeat(search_attributes), repeat(class_), chunks
+        )
+        for chunk, indices in zip(chunks, chunk_matches):
+            result.extend(chunk[i] for i in indices)
+    return result
+
+
+def bind_operator(operator: str, criterion) -> Callable[[object], bool]:
+    """Returns a one argument function comparing a value against criterion with operator."""
+    if operator not in OPERATORS:
+        raise ValueError(f"Unsupported operator: {operator}")
+    if operator in GREEK_OPERATORS:
+        return _bind_greek_operator(operator, criterion)
+    if operator in SET_OPERATORS and isinstance(criterion, (list, tuple, set)):
+        try:
+            members = frozenset(criterion)
+        except TypeError:  # unhashable criterion items, keep the generic operator
+            pass
+        else:
+            return _bind_set_operator(operator, members, criterion)
+    compare = OPERATORS[operator]
+    return lambda value: compare(value, criterion)
+
+
+def _bind_greek_operator(operator: str, criterion):
+    """The criterion is normalized once, attribute values once per distinct value"""
+    compare = OPERATORS[GREEK_OPERATORS[operator]]
+    normalized_criterion = grup(criterion)
+    normalized_values = {}
+
+    def check(value):
+        normalized = normalized_values.get(value)
+        if normalized is None:
+            normalized = normalized_values[value] = grup(value)
+        return compare(normalized, normalized_criterion)
+
+    return check
+
+
+def _bind_set_operator(operator: str, members: frozenset, criterion):
+    set_compare = SET_OPERATORS[operator]
+    compare = OPERATORS[operator]
+
+    def check(value):
+        try:
+            return set_compare(value, members)
+        except TypeError:  # unhashable value, compare against the original criterion
+            return compare(value, criterion)
+
+    return check
+
+
+def compile_query(search_attributes: dict, class_: type) -> Callable[[object], bool]:
+    """Validate search attributes once and return a reusable predicate.
+
+    parameters:
+        search_attributes: A dictionary where keys are attribute names and values are tuples of (operator, value).
+        class_: The class type of the instances to be searched.
+    returns: A function returning True for the instances matching all the conditions,
+        same as is_match. If class_ lacks any of the attributes nothing matches.
+    """
+    if not has_attributes(list(search_attributes.keys()), class_):
+        return lambda obj: False
+    checks = tuple(
+        (attrgetter(key), bind_operator(operator, value))
+        for key, (operator, value) in search_attributes.items()
+    )
+
+    def predicate(obj) -> bool:
+        for getter, check in checks:
+            if check(getter(obj)) is False:
+                return False
+        return True
+
+    return predicate
+
+
+@dataclass(frozen=True)
+class CriterionStats:
+    attribute: str
+    operator: str
+    evaluations: int
+    passes: int
+    mean_cost_ns: float
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passes / self.evaluations if self.evaluations else 1.0
+
+
+class AdaptiveQuery:
+    """Predicate that reorders its conditions to fail fast.
+
+    Every `sample_every`-th instance is evaluated with timing, collecting the
+    cost and pass rate of each condition it reaches. Every `reorder_every`
+    samples the conditions are sorted by cost / (1 - pass rate), so cheap
+    conditions that reject most instances run first. Matches are the same as
+    with compile_query, only the evaluation order (and so the number of
+    comparisons) changes.
+
+    parameters:
+        search_attributes: A dictionary where keys are attribute names and values are tuples of (operator, value).
+        class_: The class type of the instances to be searched.
+        sample_every: Sampling period in evaluated instances.
+        reorder_every: Number of samples between reorderings.
+    """
+
+    def __init__(
+        self,
+        search_attributes: dict,
+        class_: type,
+        sample_every: int = 64,
+        reorder_every: int = 16,
+    ):
+        self.valid = has_attributes(list(search_attributes.keys()), class_)
+        self.sample_every = sample_every
+        self.reorder_every = reorder_every
+        self._criteria = [
+            (key, operator, attrgetter(key), bind_operator(operator, value))
+            for key, (operator, value) in search_attributes.items()
+        ]
+        count = len(self._criteria)
+        self._order = list(range(count))
+        self._checks = [(getter, check) for _, _, getter, check in self._criteria]
+        self._evaluations = [0] * count
+        self._passes = [0] * count
+        self._cost_ns = [0] * count
+        self._seen = 0
+        self._samples = 0
+
+    def __call__(self, obj) -> bool:
+        if not self.valid:
+            return False
+        self._seen += 1
+        if self._seen % self.sample_every == 0:
+            return self._sampled_match(obj)
+        for getter, check in self._checks:
+            if check(getter(obj)) is False:
+                return False
+        return True
+
+    def _sampled_match(self, obj) -> bool:
+        matched = True
+        for index in self._order:
+            _, _, getter, check = self._criteria[index]
+            start = time.perf_counter_ns()
+            passed = check(getter(obj)) is not False
+            self._cost_ns[index] += time.perf_counter_ns() - start
+            self._evaluations[index] += 1
+            if not passed:
+                matched = False
+                break
+            self._passes[index] += 1
+        self._samples += 1
+        if self._samples % self.reorder_every == 0:
+            self._reorder()
+        return matched
+
+    def _rank(self, index: int) -> float:
+        evaluations = self._evaluations[index]
+        if not evaluations:  # never reached, keep it after the measured ones
+            return float("inf")
+        mean_cost = self._cost_ns[index] / evaluations
+        reject_rate = 1 - self._passes[index] / evaluations
+        return mean_cost / max(reject_rate, 1e-9)
+
+    def _reorder(self) -> None:
+        self._order.sort(key=self._rank)
+        self._checks = [self._criteria[i][2:] for i in self._order]
+
+    def filter(self, class_instances: Iterable) -> list:
+        """Instances matching all the conditions"""
+        return [obj for obj in class_instances if self(obj)]
+
+    def stats(self) -> list[CriterionStats]:
+        """Observed statistics per condition, in the current evaluation order"""
+        return [
+            CriterionStats(
+                attribute=self._criteria[i][0],
+                operator=self._criteria[i][1],
+                evaluations=self._evaluations[i],
+                passes=self._passes[i],
+                mean_cost_ns=(
+                    self._cost_ns[i] / self._evaluations[i]
+                    if self._evaluations[i]
+                    else 0.0
+                ),
+            )
+            for i in self._order
+        ]
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Smallest string greater than every string starting with prefix (None if unbounded)"""
+    for i in range(len(prefix) - 1, -1, -1):
+        if ord(prefix[i]) < 0x10FFFF:
+            return prefix[:i] + chr(ord(prefix[i]) + 1)
+    return None
+
+
+class IndexedCollection:
+    """In-memory collection of dataclass instances with secondary indexes for find.
+
+    Every indexed attribute gets a hash index (used for `=` and `in`) and a
+    sorted index (used for `<`, `<=`, `>`, `>=` and `startsWith`). A query uses
+    the most selective applicable index to get a candidate set and checks the
+    remaining conditions only on the candidates. An index is dropped for an
+    attribute whose values are unhashable or not mutually comparable, queries
+    on it then scan the collection.
+
+    Indexed attributes must not be modified while the instance is in the
+    collection, remove and add it again instead.
+
+    parameters:
+        class_: The class type of the instances.
+        instances: Initial instances.
+        index_attributes: Attributes to index, all dataclass fields by default.
+    """
+
+    def __init__(
+        self,
+        class_: type,
+        instances: Iterable = (),
+        index_attributes: Iterable[str] | None = None,
+    ):
+        if index_attributes is None:
+            index_attributes = list(class_.__dataclass_fields__)
+        index_attributes = list(index_attributes)
+        if not has_attributes(index_attributes, class_):
+            raise ValueError(f"Invalid index attributes for {class_.__name__}")
+        self.class_ = class_
+        self._getter = attrgetter(*index_attributes) if index_attributes else None
+        self._attributes = index_attributes
+        self._hash: dict[str, dict] = {attr: {} for attr in index_attributes}
+        self._sorted: dict[str, list] = {attr: [] for attr in index_attributes}
+        self._objects: dict[int, object] = {}
+        self._values: dict[int, tuple] = {}
+        self._seq_by_id: dict[int, int] = {}
+        self._next_seq = 0
+        self._build(instances)
+
+    def _indexed_values(self, obj) -> tuple:
+        if self._getter is None:
+            return ()
+        values = self._getter(obj)
+        return values if len(self._attributes) > 1 else (values,)
+
+    def _register(self, obj) -> tuple[int, tuple]:
+        """Stores an instance without indexing it, returns its sequence and indexed values"""
+        if id(obj) in self._seq_by_id:
+            raise ValueError(f"{obj!r} is already in the collection")
+        seq = self._next_seq
+        self._next_seq += 1
+        values = self._indexed_values(obj)
+        self._objects[seq] = obj
+        self._values[seq] = values
+        self._seq_by_id[id(obj)] = seq
+        return seq, values
+
+    def _build(self, instances: Iterable) -> None:
+        """Indexes the initial instances, sorting every index once"""
+        rows = [self._register(obj) for obj in instances]
+        for i, attr in enumerate(self._attributes):
+            # values not equal to themselves (NaN) match no comparison, find skips them
+            column = [
+                (values[i], seq) for seq, values in rows if values[i] == values[i]
+            ]
+            buckets = self._hash[attr]
+            try:
+                for value, seq in column:
+                    buckets.setdefault(value, set()).add(seq)
+            except TypeError:  # unhashable value
+                del self._hash[attr]
+            try:
+                self._sorted[attr] = sorted(column)
+            except TypeError:  # values not comparable
+                del self._sorted[attr]
+
+    def add(self, obj) -> None:
+        """Adds an instance and updates the indexes"""
+        seq, values = self._register(obj)
+        for attr, value in zip(self._attributes, values):
+            if value != value:  # NaN, never matched by an index lookup
+                continue
+            buckets = self._hash.get(attr)
+            if buckets is not None:
+                try:
+                    buckets.setdefault(value, set()).add(seq)
+                except TypeError:  # unhashable value
+                    del self._hash[attr]
+            entries = self._sorted.get(attr)
+            if entries is not None:
+                try:
+                    insort(entries, (value, seq))
+                except TypeError:  # values not comparable
+                    del self._sorted[attr]
+
+    def remove(self, obj) -> None:
+        """Removes an instance and updates the indexes"""
+        seq = self._seq_by_id.pop(id(obj))
+        del self._objects[seq]
+        values = self._values.pop(seq)
+        for attr, value in zip(self._attributes, values):
+            if value != value:  # NaN, not in the indexes
+                continue
+            buckets = self._hash.get(attr)
+            if buckets is not None:
+                bucket = buckets[value]
+                bucket.discard(seq)
+                if not bucket:
+                    del buckets[value]
+            entries = self._sorted.get(attr)
+            if entries is not None:
+                del entries[bisect_left(entries, (value, seq))]
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __iter__(self):
+        return iter(self._objects.values())
+
+    def __contains__(self, obj) -> bool:
+        return id(obj) in self._seq_by_id
+
+    def _index_plan(self, attr: str, operator: str, criterion):
+        """Returns (number of candidates, candidates producer) or None if no index applies"""
+        buckets = self._hash.get(attr)
+        if buckets is not None:
+            try:
+                if operator == "=":
+                    bucket = buckets.get(criterion, set())
+                    return len(bucket), lambda: bucket
+                if operator == "in" and isinstance(criterion, (list, tuple, set)):
+                    if any(v != v for v in criterion):
+                        # find matches a NaN member by identity, the index cannot
+                        return None
+                    groups = [buckets[v] for v in set(criterion) if v in buckets]
+                    return sum(map(len, groups)), lambda: set().union(*groups)
+            except TypeError:  # unhashable criterion
+                return None
+        entries = self._sorted.get(attr)
+        if entries is None:
+            return None
+        try:
+            bounds = self._sorted_bounds(entries, operator, criterion)
+        except TypeError:  # criterion not comparable with the values
+            return None
+        if bounds is None:
+            return None
+        low, high = bounds
+        return high - low, lambda: [seq for _, seq in entries[low:high]]
+
+    @staticmethod
+    def _sorted_bounds(entries: list, operator: str, criterion):
+        key = itemgetter(0)
+        if operator in ("<", "<=", ">", ">=") and criterion != criterion:
+            return 0, 0  # nothing compares with NaN
+        if operator == "<":
+            return 0, bisect_left(entries, criterion, key=key)
+        if operator == "<=":
+            return 0, bisect_right(entries, criterion, key=key)
+        if operator == ">":
+            return bisect_right(entries, criterion, key=key), len(entries)
+        if operator == ">=":
+            return bisect_left(entries, criterion, key=key), len(entries)
+        if operator == "startsWith" and isinstance(criterion, str):
+            low = bisect_left(entries, criterion, key=key)
+            upper = _prefix_upper_bound(criterion)
+            if upper is None:
+                return low, len(entries)
+            return low, bisect_left(entries, upper, key=key)
+        return None
+
+    def find(self, search_attributes: dict) -> list:
+        """Instances matching all the conditions, in insertion order, same as find"""
+        if not has_attributes(list(search_attributes.keys()), self.class_):
+            return []
+        best = None
+        for attr, (operator, criterion) in search_attributes.items():
+            if operator not in OPERATORS:
+                raise ValueError(f"Unsupported operator: {operator}")
+            plan = self._index_plan(attr, operator, criterion)
+            if plan is not None and (best is None or plan[0] < best[1][0]):
+                best = attr, plan
+        if best is None:
+            predicate = compile_query(search_attributes, self.class_)
+            return [obj for obj in self._objects.values() if predicate(obj)]
+        indexed_attr, (_, candidates) = best
+        remaining = {k: v for k, v in search_attributes.items() if k != indexed_attr}
+        predicate = compile_query(remaining, self.class_)
+        objects = self._objects
+        return [objects[seq] for seq in sorted(candidates()) if predicate(objects[seq])]
+
+
+# Largest integer a float64 represents exactly, beyond it mixed int/float comparisons lose precision
+_MAX_EXACT_FLOAT_INT = 2**53
+
+_NUMPY_COMPARISONS = {
+    "=": op.eq,
+    "!=": op.ne,
+    "<": op.lt,
+    "<=": op.le,
+    ">": op.gt,
+    ">=": op.ge,
+}
+
+
+def _numpy_column(values: list) -> "np.ndarray":
+    """Typed NumPy array for homogeneous str/int/float/bool values, object array otherwise"""
+    types = set(map(type, values))
+    try:
+        if types == {str}:
+            return np.array(values, dtype=np.dtypes.StringDType())
+        if types == {bool}:
+            return np.array(values, dtype=np.bool_)
+        if types == {int}:
+            return np.array(values, dtype=np.int64)
+        if types == {float}:
+            return np.array(values, dtype=np.float64)
+    except OverflowError:  # ints out of int64 range
+        pass
+    except UnicodeEncodeError:  # lone surrogates, StringDType stores UTF-8
+        pass
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _is_utf8(text: str) -> bool:
+    """False for str with lone surrogates, which StringDType cannot store"""
+    try:
+        text.encode()
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def _is_compatible(column: "np.ndarray", value) -> bool:
+    """True if comparing value with the column in NumPy gives the same result as in Python"""
+    kind = column.dtype.kind
+    if kind == "T":
+        return type(value) is str and _is_utf8(value)
+    if kind == "b":
+        return type(value) is bool
+    if kind == "i":
+        return type(value) is int and -(2**63) <= value < 2**63
+    if kind == "f":
+        return type(value) is float or (
+            type(value) is int and abs(value) <= _MAX_EXACT_FLOAT_INT
+        )
+    return False
+
+
+def _numpy_mask(column: "np.ndarray", operator: str, criterion):
+    """Vectorized mask for operator on column, None if it cannot be computed exactly"""
+    if operator in _NUMPY_COMPARISONS:
+        if _is_compatible(column, criterion):
+            return _NUMPY_COMPARISONS[operator](column, criterion)
+        return None
+    if operator in ("in", "not_in"):
+        # Python membership also matches by identity, so NaN items are left to OPERATORS
+        if not isinstance(criterion, (list, tuple, set)) or not all(
+            _is_compatible(column, item) and item == item for item in criterion
+        ):
+            return None
+        return np.isin(column, list(criterion), invert=operator == "not_in")
+    if column.dtype.kind != "T" or not _is_compatible(column, criterion):
+        return None
+    if operator == "contains":
+        return np.strings.find(column, criterion) >= 0
+    if operator == "not_contains":
+        return np.strings.find(column, criterion) < 0
+    if operator == "startsWith":
+        return np.strings.startswith(column, criterion)
+    if operator == "endsWith":
+        return np.strings.endswith(column, criterion)
+    return None
+
+
+class ColumnarCollection:
+    """Struct-of-arrays view of dataclass instances for vectorized find.
+
+    Each queried attribute is converted once to a NumPy array (typed for
+    homogeneous str, int, float and bool values) and conditions are evaluated
+    as boolean masks, Greek operators on a normalized copy of the column.
+    Conditions that cannot be vectorized exactly, e.g. the list operators or
+    object columns, are evaluated with OPERATORS only on the rows still
+    matching, so results are identical to find. Requires numpy.
+
+    parameters:
+        class_: The class type of the instances.
+        instances: The instances, they should not be modified afterwards.
+    """
+
+    def __init__(self, class_: type, instances: Iterable):
+        if np is None:
+            raise ImportError("ColumnarCollection requires numpy")
+        self.class_ = class_
+        self.instances = list(instances)
+        self._columns: dict[str, np.ndarray] = {}
+        self._normalized_columns: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.instances)
+
+    def column(self, attribute: str) -> "np.ndarray":
+        """The NumPy array of an attribute, built on first use"""
+        column = self._columns.get(attribute)
+        if column is None:
+            values = list(map(attrgetter(attribute), self.instances))
+            column = self._columns[attribute] = _numpy_column(values)
+        return column
+
+    def normalized_column(self, attribute: str) -> "np.ndarray":
+        """The grup normalized array of a str attribute, built on first use"""
+        column = self._normalized_columns.get(attribute)
+        if column is None:
+            column = grup_array(self.column(attribute))
+            self._normalized_columns[attribute] = column
+        return column
+
+    def find_indices(self, search_attributes: dict) -> "np.ndarray":
+        """Indices of the instances matching all the conditions"""
+        if not has_attributes(list(search_attributes.keys()), self.class_):
+            return np.empty(0, dtype=np.intp)
+        for operator, _ in search_attributes.values():
+            if operator not in OPERATORS:
+                raise ValueError(f"Unsupported operator: {operator}")
+        mask = np.ones(len(self.instances), dtype=bool)
+        for attribute, (operator, criterion) in search_attributes.items():
+            column = self.column(attribute)
+            if (
+                operator in GREEK_OPERATORS
+                and column.dtype.kind == "T"
+                and type(criterion) is str
+            ):
+                vector_mask = _numpy_mask(
+                    self.normalized_column(attribute),
+                    GREEK_OPERATORS[operator],
+                    grup(criterion),
+                )
+            else:
+                vector_mask = _numpy_mask(column, operator, criterion)
+            if vector_mask is not None:
+                mask &= vector_mask
+            else:
+                rows = np.flatnonzero(mask)
+                compare = OPERATORS[operator]
+                mask[rows] = [
+                    compare(value, criterion) is not False
+                    for value in column[rows].tolist()
+                ]
+            if not mask.any():
+                break
+        return np.flatnonzero(mask)
+
+    def find(self, search_attributes: dict) -> list:
+        """Instances matching all the conditions, same as find"""
+        instances = self.instances
+        return [instances[i] for i in self.find_indices(search_attributes)]
@@ -0,0 +1,259 @@
+"""Streaming transcoder of Greek formatted CSV columns.
+
+Rewrites date columns between Greek (DD/MM/YYYY) and ISO (YYYY-MM-DD) format
+and number columns between Greek (1.234,56) and standard (1234.56) format.
+The input is read and written in chunks of rows, so memory stays bounded, and
+chunks can be converted by several worker processes.
+
+    python -m utils.csvtranscode input.csv output.csv --gr2iso date --gr2float amount
+"""
+
+import argparse
+import csv
+import multiprocessing
+import re
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import partial
+from itertools import islice
+
+from utils.datetimes import gr2iso_many, iso2gr_many
+from utils.numbers import GR_SEPARATORS_TABLE, is_greek_number
+
+CONVERSIONS = ("gr2iso", "iso2gr", "gr2float", "float2gr")
+
+# Plain decimal numbers of the standard side: no exponent, nan or inf
+STANDARD_NUMBER_RE = re.compile(r"[-+]?\d+(?:\.\d+)?", re.ASCII)
+GR_TO_STANDARD_TABLE = str.maketrans({".": None, ",": "."})
+
+
+class TranscodeError(ValueError):
+    """Invalid value in a transcoded column"""
+
+    def __init__(self, row: int, column: str, value: str, conversion: str):
+        super().__init__(
+            f"Row {row}, column {column!r}: cannot apply {conversion} to {value!r}"
+        )
+        self.row = row
+        self.column = column
+        self.value = value
+        self.conversion = conversion
+
+    def __reduce__(self):
+        # raised in worker processes, rebuilt from the fields in the parent
+        return type(self), (self.row, self.column, self.value, self.conversion)
+
+
+@dataclass(frozen=True)
+class TranscodeStats:
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def _gr2float_text(value: str) -> str | None:
+    """Greek number text to standard number text, without going through float"""
+    if not is_greek_number(value):
+        return None
+    return value.translate(GR_TO_STANDARD_TABLE)
+
+
+def _float2gr_text(value: str, decimals: int) -> str | None:
+    """Standard number text to Greek number text, rounded exactly with Decimal"""
+    if STANDARD_NUMBER_RE.fullmatch(value) is None:
+        return None
+    return format(Decimal(value), f",.{decimals}f").translate(GR_SEPARATORS_TABLE)
+
+
+def _column_converter(conversion: str, decimals: int) -> Callable[[list], list]:
+    """Function converting a list of non empty cells, None marks an invalid cell"""
+    if conversion == "gr2iso":
+        return partial(gr2iso_many, errors="coerce")
+    if conversion == "iso2gr":
+        return partial(iso2gr_many, errors="coerce")
+    if conversion == "gr2float":
+        return lambda values: [_gr2float_text(value) for value in values]
+    if conversion == "float2gr":
+        return lambda values: [_float2gr_text(value, decimals) for value in values]
+    raise ValueError(f"Unsupported conversion: {conversion}")
+
+
+def _transcode_chunk(
+    columns: tuple, decimals: int, errors: str, chunk: tuple[int, list]
+) -> list:
+    """Converts the columns of a chunk of rows, runs in the worker processes too.
+
+    columns: (index, name, conversion) of the converted columns
+    chunk: (index of the first row, rows)
+    """
+    first_row, rows = chunk
+    for index, name, conversion in columns:
+        convert = _column_converter(conversion, decimals)
+        positions = [i for i, row in enumerate(rows) if index < len(row) and row[index]]
+        converted = convert([rows[i][index] for i in positions])
+        for i, value in zip(positions, converted):
+            if value is not None:
+                rows[i][index] = value
+            elif errors == "raise":
+                raise TranscodeError(first_row + i, name, rows[i][index], conversion)
+    return rows
+
+
+def _chunks(rows: Iterator[list], chunk_size: int) -> Iterator[tuple[int, list]]:
+    first_row = 0
+    while chunk := list(islice(rows, chunk_size)):
+        yield first_row, chunk
+        first_row += len(chunk)
+
+
+def _ordered_map(func: Callable, chunks: Iterable, workers: int) -> Iterator:
+    """map in a process pool keeping at most 2 chunks per worker in flight"""
+    if workers <= 1:
+        yield from map(func, chunks)
+        return
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _resolve_column(column: str, header: list | None) -> int:
+    """Column index from a header name or a 0-based index"""
+    if header is not None and column in header:
+        return header.index(column)
+    if column.isdigit():
+        return int(column)
+    raise ValueError(f"Unknown column: {column}")
+
+
+def transcode_csv(
+    source,
+    target,
+    *,
+    conversions: dict[str, Iterable[str]],
+    decimals: int = 2,
+    delimiter: str = ",",
+    header: bool = True,
+    chunk_size: int = 10_000,
+    workers: int = 1,
+    errors: str = "raise",
+) -> TranscodeStats:
+    """
+    Transcode the columns of a CSV stream chunk by chunk.
+
+    Parameters:
+    source: Readable text file object, opened with newline="".
+    target: Writable text file object, opened with newline="".
+    conversions: Columns (header names or 0-based indices) per conversion,
+                 e.g. {"gr2iso": ["date"], "gr2float": ["amount"]}.
+    decimals: Decimals of the float2gr output.
+    delimiter: Field delimiter of both input and output.
+    header: The first row is a header, copied as is.
+    chunk_size: Number of rows converted at once.
+    workers: Number of worker processes.
+    errors: "raise" raises TranscodeError for invalid cells, "keep" leaves them unchanged.
+
+    Returns:
+    TranscodeStats: Number of data rows and elapsed time.
+    """
+    if errors not in ("raise", "keep"):
+        raise ValueError(f"errors must be 'raise' or 'keep': {errors!r}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive: {chunk_size}")
+    start = time.perf_counter()
+    reader = csv.reader(source, delimiter=delimiter)
+    writer = csv.writer(target, delimiter=delimiter, lineterminator="\n")
+    header_row = next(reader, None) if header else None
+    if header_row is not None:
+        writer.writerow(header_row)
+    columns = []
+    for conversion, names in conversions.items():
+        if conversion not in CONVERSIONS:
+            raise ValueError(f"Unsupported conversion: {conversion}")
+        for name in names:
+            columns.append((_resolve_column(name, header_row), name, conversion))
+    convert_chunk = partial(_transcode_chunk, tuple(columns), decimals, errors)
+    rows = 0
+    for converted in _ordered_map(convert_chunk, _chunks(reader, chunk_size), workers):
+        writer.writerows(converted)
+        rows += len(converted)
+    return TranscodeStats(rows=rows, seconds=time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.csvtranscode",
+        description="Rewrite Greek date and number columns of a CSV file.",
+    )
+    parser.add_argument("source", help="input CSV file, - for stdin")
+    parser.add_argument("target", help="output CSV file, - for stdout")
+    for conversion in CONVERSIONS:
+        parser.add_argument(
+            f"--{conversion}",
+            action="append",
+            default=[],
+            metavar="COLUMN",
+            help=f"column (name or 0-based index) to convert with {conversion}",
+        )
+    parser.add_argument("--decimals", type=int, default=2)
+    parser.add_argument("--delimiter", default=",")
+    parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument("--no-header", action="store_true")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--errors", choices=("raise", "keep"), default="raise")
+    parser.add_argument("--quiet", action="store_true", help="do not report speed")
+    args = parser.parse_args(argv)
+
+    if args.source == "-":
+        source = open(
+            sys.stdin.fileno(), encoding=args.encoding, newline="", closefd=False
+        )
+    else:
+        source = open(args.source, encoding=args.encoding, newline="")
+    if args.target == "-":
+        target = open(
+            sys.stdout.fileno(), "w", encoding=args.encoding, newline="", closefd=False
+        )
+    else:
+        target = open(args.target, "w", encoding=args.encoding, newline="")
+    with source, target:
+        try:
+            stats = transcode_csv(
+                source,
+                target,
+                conversions={c: getattr(args, c) for c in CONVERSIONS},
+                decimals=args.decimals,
+                delimiter=args.delimiter,
+                header=not args.no_header,
+                chunk_size=args.chunk_size,
+                workers=args.workers,
+                errors=args.errors,
+            )
+        except ValueError as error:
+            print(f"error: {error}", file=sys.stderr)
+            return 1
+    if not args.quiet:
+        print(
+            f"{stats.rows} rows in {stats.seconds:.2f}s"
+            f" ({stats.rows_per_second:,.0f} rows/s)",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
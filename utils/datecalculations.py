@@ -1,7 +1,24 @@
+import heapq
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
 from calendar import SATURDAY, SUNDAY, monthrange
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import date, datetime, time, timedelta
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# Weekday bit masks, bit 0 is Monday and bit 6 is Sunday
+MONDAY_TO_FRIDAY = 0b0011111
+ALL_WEEKDAYS = 0b1111111
+
 
 @dataclass(frozen=True)
 class DayNightHours:
@@ -13,10 +30,33 @@ class DayNightHours:
         return self.day_hours + self.night_hours
 
 
+def delta_minutes(date_from: datetime, date_to: datetime) -> int:
+    """Returns whole minutes between two datetime objects, exact for any span"""
+    return abs(date_to - date_from) // timedelta(minutes=1)
+
+
+def minutes2hours(minutes: int) -> float:
+    """Minutes as hours rounded to 0.1h"""
+    return round(minutes / 60, 1)
+
+
 def delta_hours(date_from: datetime, date_to: datetime) -> float:
     """Returns hours between two datetime objects"""
-    delta = abs(date_to - date_from)
-    return round(delta.seconds / 3600, 1)
+    return minutes2hours(delta_minutes(date_from, date_to))
+
+
+def delta_hours_many(deltas) -> "np.ndarray":
+    """delta_hours of a timedelta64 array (any unit), NaN for NaT"""
+    if np is None:
+        raise ImportError("delta_hours_many requires numpy")
+    deltas = np.asarray(deltas)
+    if deltas.dtype.kind != "m":
+        raise ValueError(f"Expected a timedelta64 array: {deltas.dtype}")
+    nat = np.isnat(deltas)
+    minutes = np.abs(deltas).astype("timedelta64[m]").astype(np.int64)
+    hours = _round_hours(np.where(nat, 0, minutes))
+    hours[nat] = np.nan
+    return hours
 
 
 def round_half(hours: float) -> float:
@@ -24,18 +64,35 @@ def round_half(hours: float) -> float:
     return round(hours * 2) / 2
 
 
-def month_monday2friday_days(year: int, month: int) -> int:
-    """Calculate the number of working days in a given month, excluding weekends and specified holidays."""
+def weekday_mask(weekdays: set[int]) -> int:
+    """Bit mask of a set of weekdays (0=Monday, 6=Sunday), bit i set for weekday i"""
+    mask = 0
+    for weekday in weekdays:
+        if weekday not in range(7):
+            raise ValueError(f"Weekday must be between 0 and 6: {weekday}")
+        mask |= 1 << weekday
+    return mask
 
-    total_days = monthrange(year, month)[1]
-    working_days = 0
 
-    for day in range(1, total_days + 1):
-        current_date = datetime(year, month, day).date()
-        if current_date.weekday() not in (SATURDAY, SUNDAY):
-            working_days += 1
+def _month_weekday_count(year: int, month: int, mask: int) -> int:
+    """Weekdays of the mask in a month, from the weekday of the 1st and the month length.
+
+    Every weekday occurs 4 times in the first 28 days, the remaining 0-3 days
+    start on the weekday of the 1st.
+    """
+    first_weekday, total_days = monthrange(year, month)
+    count = 4 * bin(mask & ALL_WEEKDAYS).count("1")
+    for extra in range(total_days - 28):
+        count += (mask >> ((first_weekday + extra) % 7)) & 1
+    return count
+
+
+def month_monday2friday_days(year: int, month: int) -> int:
+    """Calculate the number of weekdays (Monday to Friday) in a given month.
 
-    return working_days
+    Public holidays are not excluded, WorkingCalendar.working_days_in_month does that.
+    """
+    return _month_weekday_count(year, month, MONDAY_TO_FRIDAY)
 
 
 def month_specific_days(year: int, month: int, weekdays: set[int]) -> int:
@@ -47,15 +104,45 @@ def month_specific_days(year: int, month: int, weekdays: set[int]) -> int:
     :return: The count of specified weekdays in the month.
     """
     assert month in range(1, 13), "Month must be between 1 and 12"
-    total_days = monthrange(year, month)[1]
-    specific_days_count = 0
+    mask = 0
+    for weekday in weekdays:
+        if weekday in range(7):
+            mask |= 1 << weekday
+    return _month_weekday_count(year, month, mask)
+
 
-    for day in range(1, total_days + 1):
-        current_date = datetime(year, month, day).date()
-        if current_date.weekday() in weekdays:
-            specific_days_count += 1
+def month_specific_days_many(years, months, masks=MONDAY_TO_FRIDAY):
+    """Count the weekdays of many months at once with NumPy.
 
-    return specific_days_count
+    :param years: Years, array-like of ints.
+    :param months: Months (1-12), array-like of ints.
+    :param masks: Weekday bit masks (see weekday_mask), one per month or a single one.
+    :return: int64 array of counts, in the broadcast shape of the arguments.
+    """
+    if np is None:
+        raise ImportError("month_specific_days_many requires numpy")
+    years, months, masks = np.broadcast_arrays(
+        np.asarray(years, dtype=np.int64),
+        np.asarray(months, dtype=np.int64),
+        np.asarray(masks, dtype=np.int64),
+    )
+    if ((months < 1) | (months > 12)).any():
+        raise ValueError("Month must be between 1 and 12")
+    first = ((years - 1970) * 12 + months - 1).astype("datetime64[M]")
+    first_days = first.astype("datetime64[D]").astype(np.int64)
+    total_days = (first + np.timedelta64(1, "M")).astype("datetime64[D]").astype(
+        np.int64
+    ) - first_days
+    # 1970-01-01 was a Thursday
+    first_weekday = (first_days + 3) % 7
+    counts = np.zeros(years.shape, dtype=np.int64)
+    for weekday in range(7):
+        counts += (masks >> weekday) & 1
+    counts *= 4
+    for extra in range(3):
+        weekday_bit = (masks >> ((first_weekday + extra) % 7)) & 1
+        counts += weekday_bit * (total_days - 28 > extra)
+    return counts
 
 
 def month_specific_days_gr(
@@ -105,10 +192,49 @@ def month_total_days(year: int, month: int) -> int:
     return monthrange(year, month)[1]
 
 
+# Day hours are 06:00-22:00, in minutes from midnight
+DAY_START_MINUTE = 6 * 60
+DAY_END_MINUTE = 22 * 60
+MINUTES_PER_DAY = 24 * 60
+DAY_MINUTES_PER_DAY = DAY_END_MINUTE - DAY_START_MINUTE
+MICROSECONDS_PER_MINUTE = 60_000_000
+
+
+def _day_time_until(offset: int, per_minute: int = 1) -> int:
+    """Day time from midnight of a reference date up to an offset from it, in 1/per_minute minutes"""
+    days, time_of_day = divmod(offset, MINUTES_PER_DAY * per_minute)
+    today = min(
+        max(time_of_day - DAY_START_MINUTE * per_minute, 0),
+        DAY_MINUTES_PER_DAY * per_minute,
+    )
+    return days * DAY_MINUTES_PER_DAY * per_minute + today
+
+
+def _day_night_minutes(dfrom: datetime, dto: datetime) -> tuple[int, int]:
+    """Day and night minutes of a time range of any length.
+
+    Sweeps the 06:00 and 22:00 boundaries in closed form: the day time up to
+    a moment is the full days times 16 hours plus the part of its own day.
+    The day time is exact in microseconds and floored to minutes once, the
+    night minutes are the rest of delta_minutes.
+    """
+    midnight = datetime.combine(dfrom, time(0, 0), tzinfo=dfrom.tzinfo)
+    start = (dfrom - midnight) // timedelta(microseconds=1)
+    end = (dto - midnight) // timedelta(microseconds=1)
+    day_time = _day_time_until(end, MICROSECONDS_PER_MINUTE) - _day_time_until(
+        start, MICROSECONDS_PER_MINUTE
+    )
+    day = day_time // MICROSECONDS_PER_MINUTE
+    return day, (end - start) // MICROSECONDS_PER_MINUTE - day
+
+
 def daynight_hours(dfrom: datetime, dto: datetime) -> DayNightHours:
     """
     Calculate the number of day and night hours between two datetime objects.
 
+    Day hours are 06:00-22:00, the range may have any length. The exact
+    minutes of each part are rounded once to 0.1h.
+
     Parameters:
     - dfrom: datetime object representing the start datetime
     - dto: datetime object representing the end datetime
@@ -116,62 +242,10 @@ def daynight_hours(dfrom: datetime, dto: datetime) -> DayNightHours:
     Returns:
     - HOURS object containing the number of day and night hours
     """
-    day_start = time(6, 0)  # 6:00 AM
-    day_end = time(22, 0)  # 10:00 PM
-    dt_day_start = datetime.combine(dfrom, day_start)
-    dt_day_end = datetime.combine(dfrom, day_end)
-    dt_next_day_start = dt_day_start + timedelta(days=1)
-
-    # dts: dt_day_start, dte: dt_day_end, ndts: dt_next_day_start
-    #
-    #       dts            dte       ndts
-    # 0     6              22        6                22
-    #  -----|---------------|--+-----|----------------|--
-    # 1  *-*|               |        |
-    # 2  *--|----------*    |        |
-    #    *--|---------------|-*      |    impossible
-    # 3     |  *--------*   |        |
-    # 4     |            *--|------* |
-    # 5     |             *-|--------|--*
-    # 6     |               |   *---*|
-    # 7     |               |   *----|-------*
-
-    night_hours = 0
-    day_hours = 0
-
-    # 1
-    if dfrom < dt_day_start and dto <= dt_day_start:
-        night_hours += delta_hours(dfrom, dto)
-    # 2
-    elif dfrom < dt_day_start and dt_day_start <= dto <= dt_day_end:
-        night_hours += delta_hours(dfrom, dt_day_start)
-        day_hours += delta_hours(dt_day_start, dto)
-    # 3
-    elif dt_day_start <= dfrom <= dt_day_end and dt_day_start < dto <= dt_day_end:
-        day_hours += delta_hours(dfrom, dto)
-    # 4
-    elif dt_day_start < dfrom < dt_day_end and dt_day_end < dto <= dt_next_day_start:
-        day_hours += delta_hours(dfrom, dt_day_end)
-        night_hours += delta_hours(dt_day_end, dto)
-    # 5
-    elif dt_day_start < dfrom < dt_day_end and dt_next_day_start < dto:
-        day_hours += delta_hours(dfrom, dt_day_end)
-        night_hours += delta_hours(dt_day_end, dt_next_day_start)
-        day_hours += delta_hours(dt_next_day_start, dto)
-    # 6
-    elif (
-        dt_day_end <= dfrom < dt_next_day_start
-        and dt_day_end < dto <= dt_next_day_start
-    ):
-        night_hours += delta_hours(dfrom, dto)
-    # 7
-    elif dt_day_end <= dfrom < dt_next_day_start and dt_next_day_start < dto:
-        night_hours += delta_hours(dfrom, dt_next_day_start)
-        day_hours += delta_hours(dt_next_day_start, dto)
-    else:
+    if dto < dfrom:
         raise ValueError(f"Wrong TimeRange {dfrom}-{dto}")
-
-    return DayNightHours(day_hours=day_hours, night_hours=night_hours)
+    day, night = _day_night_minutes(dfrom, dto)
+    return DayNightHours(day_hours=minutes2hours(day), night_hours=minutes2hours(night))
 
 
 def do_overlap(from1: datetime, to1: datetime, from2: datetime, to2: datetime) -> bool:
@@ -179,6 +253,306 @@ def do_overlap(from1: datetime, to1: datetime, from2: datetime, to2: datetime) -
     return from1 < to2 and from2 < to1
 
 
+@dataclass(frozen=True)
+class DayNightHoursArray:
+    """Day and night hours of many shifts, as two float arrays"""
+
+    day_hours: "np.ndarray"
+    night_hours: "np.ndarray"
+
+    @property
+    def total_hours(self) -> "np.ndarray":
+        return self.day_hours + self.night_hours
+
+    def __len__(self) -> int:
+        return len(self.day_hours)
+
+    def __getitem__(self, index: int) -> DayNightHours:
+        return DayNightHours(
+            day_hours=float(self.day_hours[index]),
+            night_hours=float(self.night_hours[index]),
+        )
+
+
+def _round_hours(minutes: "np.ndarray") -> "np.ndarray":
+    """round(minutes / 60, 1) for every element of a non negative int64 array.
+
+    Python rounds the float quotient by its exact binary value, ties to even.
+    Minutes ending in 3 of 6 lie on a decimal half (k.k5), there the float
+    quotient is compared exactly with the half as integers: mantissa * 20
+    against (2 * tenths + 1) * 2**(53 - exponent).
+    """
+    tenths, remainder = np.divmod(minutes, 6)
+    up = remainder > 3
+    ties = remainder == 3
+    if ties.any():
+        mantissa, exponent = np.frexp(minutes[ties] / 60)
+        binary = (mantissa * 2.0**53).astype(np.int64) * 20
+        half = (2 * tenths[ties] + 1) << (53 - exponent).astype(np.int64)
+        up[ties] = (binary > half) | ((binary == half) & (tenths[ties] % 2 == 1))
+    return (tenths + up) / 10
+
+
+def _day_time_until_many(offsets: "np.ndarray", per_minute: int) -> "np.ndarray":
+    days, time_of_day = np.divmod(offsets, MINUTES_PER_DAY * per_minute)
+    today = np.clip(
+        time_of_day - DAY_START_MINUTE * per_minute,
+        0,
+        DAY_MINUTES_PER_DAY * per_minute,
+    )
+    return days * DAY_MINUTES_PER_DAY * per_minute + today
+
+
+def daynight_hours_many(starts, ends) -> DayNightHoursArray:
+    """Day (06:00-22:00) and night hours of many shifts with array arithmetic.
+
+    starts, ends: datetime64 arrays (any unit down to microseconds).
+    Matches daynight_hours: minutes from the closed-form boundary sweep,
+    rounded once to 0.1h as delta_hours rounds. NaT gives NaN hours.
+    """
+    if np is None:
+        raise ImportError("daynight_hours_many requires numpy")
+    starts = np.asarray(starts, dtype="datetime64[us]")
+    ends = np.asarray(ends, dtype="datetime64[us]")
+    valid = ~(np.isnat(starts) | np.isnat(ends))
+    # microseconds since 1970-01-01 00:00, a midnight
+    start = starts.astype(np.int64)
+    end = ends.astype(np.int64)
+    wrong = valid & (end < start)
+    if wrong.any():
+        row = int(np.flatnonzero(wrong)[0])
+        raise ValueError(f"Wrong TimeRange {starts[row]}-{ends[row]} at row {row}")
+    start = np.where(valid, start, 0)
+    end = np.where(valid, end, 0)
+    day_time = _day_time_until_many(
+        end, MICROSECONDS_PER_MINUTE
+    ) - _day_time_until_many(start, MICROSECONDS_PER_MINUTE)
+    day = day_time // MICROSECONDS_PER_MINUTE
+    day_hours = _round_hours(day)
+    night_hours = _round_hours((end - start) // MICROSECONDS_PER_MINUTE - day)
+    day_hours[~valid] = np.nan
+    night_hours[~valid] = np.nan
+    return DayNightHoursArray(day_hours=day_hours, night_hours=night_hours)
+
+
+@dataclass(frozen=True)
+class Shift:
+    start: datetime
+    end: datetime
+    key: object = None
+
+    def __post_init__(self):
+        if self.end < self.start:
+            raise ValueError(f"Wrong TimeRange {self.start}-{self.end}")
+
+    @property
+    def day_night_hours(self) -> DayNightHours:
+        return daynight_hours(self.start, self.end)
+
+
+def find_overlaps(shifts: Iterable[Shift]) -> list[tuple[Shift, Shift]]:
+    """All pairs of overlapping shifts, in O(n log n + pairs) with a sweep line.
+
+    The shifts are swept by start time keeping a heap of the active shift
+    ends; a shift overlaps every active shift ending after its start. As in
+    do_overlap, touching shifts (one ends when the other starts) do not
+    overlap and a zero-length shift overlaps only the shifts it falls
+    strictly inside.
+    """
+    overlaps = []
+    active = []  # (end, sequence, shift)
+    ordered = sorted(shifts, key=lambda shift: (shift.start, shift.end))
+    for sequence, shift in enumerate(ordered):
+        while active and active[0][0] <= shift.start:
+            heapq.heappop(active)
+        # a zero-length shift sorts before the shifts starting with it, so the
+        # active ones all started earlier
+        overlaps.extend((other, shift) for _, _, other in active)
+        if shift.start < shift.end:
+            heapq.heappush(active, (shift.end, sequence, shift))
+    return overlaps
+
+
+class ShiftSchedule:
+    """Shifts kept sorted by start time, for overlap queries and day/night totals.
+
+    A shift overlapping a time range starts before the range end and no
+    earlier than the range start minus the longest shift, so a query bisects
+    that window of the sorted starts instead of scanning all the shifts.
+
+    parameters:
+        shifts: Initial shifts.
+    """
+
+    def __init__(self, shifts: Iterable[Shift] = ()):
+        self._shifts = sorted(shifts, key=lambda shift: (shift.start, shift.end))
+        self._starts = [shift.start for shift in self._shifts]
+        self._longest = max(
+            (shift.end - shift.start for shift in self._shifts), default=timedelta(0)
+        )
+
+    def add(self, shift: Shift) -> None:
+        index = bisect_left(self._starts, shift.start)
+        while index < len(self._shifts) and (
+            self._starts[index] == shift.start and self._shifts[index].end < shift.end
+        ):
+            index += 1
+        self._starts.insert(index, shift.start)
+        self._shifts.insert(index, shift)
+        self._longest = max(self._longest, shift.end - shift.start)
+
+    def __len__(self) -> int:
+        return len(self._shifts)
+
+    def __iter__(self):
+        return iter(self._shifts)
+
+    def overlapping(self, dfrom: datetime, dto: datetime) -> list[Shift]:
+        """Shifts overlapping the time range dfrom-dto, in start order"""
+        first = bisect_left(self._starts, dfrom - self._longest)
+        last = bisect_left(self._starts, dto, lo=first)
+        return [
+            shift
+            for shift in self._shifts[first:last]
+            if do_overlap(shift.start, shift.end, dfrom, dto)
+        ]
+
+    def overlaps(self) -> list[tuple[Shift, Shift]]:
+        """All pairs of overlapping shifts"""
+        return find_overlaps(self._shifts)
+
+    def day_night_hours(self) -> DayNightHours:
+        """Day and night hours of all the shifts, rounded once to 0.1h"""
+        day = night = 0
+        for shift in self._shifts:
+            shift_day, shift_night = _day_night_minutes(shift.start, shift.end)
+            day += shift_day
+            night += shift_night
+        return DayNightHours(
+            day_hours=minutes2hours(day), night_hours=minutes2hours(night)
+        )
+
+
+@dataclass(frozen=True)
+class HourBuckets:
+    """Hours of shifts per payroll bucket.
+
+    day_hours and night_hours split all the hours, sunday_hours and
+    holiday_hours are the hours on Sundays and public holidays, and
+    overtime_hours the hours above each overtime threshold of a shift.
+    """
+
+    day_hours: float
+    night_hours: float
+    sunday_hours: float
+    holiday_hours: float
+    overtime_hours: tuple[float, ...]
+
+    @property
+    def total_hours(self) -> float:
+        return self.day_hours + self.night_hours
+
+
+class ShiftClassifier:
+    """Splits shifts into hour buckets in a single pass over their days.
+
+    parameters:
+        night_start: Start of the night hours (22:00 by default).
+        night_end: End of the night hours (06:00 by default), may be after night_start.
+        overtime_after: Shift hours after which each overtime tier starts,
+                        e.g. (8, 9) gives the hours 8-9 and the hours above 9.
+        extra_holidays: Dates counted as holidays besides greek_holidays.
+    """
+
+    def __init__(
+        self,
+        night_start: time = time(22, 0),
+        night_end: time = time(6, 0),
+        overtime_after: Iterable[float] = (8,),
+        extra_holidays: Iterable[date] = (),
+    ):
+        if night_start == night_end:
+            raise ValueError(f"Empty night window {night_start}-{night_end}")
+        start = night_start.hour * 60 + night_start.minute
+        end = night_end.hour * 60 + night_end.minute
+        if start < end:
+            self._night_windows = ((start, end),)
+        else:
+            self._night_windows = ((0, end), (start, MINUTES_PER_DAY))
+        self._overtime_after = tuple(round(hours * 60) for hours in overtime_after)
+        if list(self._overtime_after) != sorted(set(self._overtime_after)):
+            raise ValueError(f"Overtime thresholds must increase: {overtime_after}")
+        self._extra_holidays = frozenset(extra_holidays)
+        self._date_flags: dict[date, tuple[bool, bool]] = {}
+
+    def _flags(self, day: date) -> tuple[bool, bool]:
+        """(Sunday, holiday) of a date, computed once per date"""
+        flags = self._date_flags.get(day)
+        if flags is None:
+            flags = (
+                day.weekday() == SUNDAY,
+                is_holiday(day) or day in self._extra_holidays,
+            )
+            self._date_flags[day] = flags
+        return flags
+
+    def _minutes(self, dfrom: datetime, dto: datetime) -> list[int]:
+        """[day, night, Sunday, holiday, overtime tiers...] minutes of a shift"""
+        if dto < dfrom:
+            raise ValueError(f"Wrong TimeRange {dfrom}-{dto}")
+        # exact microseconds, every bucket floored to minutes once as delta_minutes
+        unit = MICROSECONDS_PER_MINUTE
+        midnight = datetime.combine(dfrom, time(0, 0), tzinfo=dfrom.tzinfo)
+        start = (dfrom - midnight) // timedelta(microseconds=1)
+        end = (dto - midnight) // timedelta(microseconds=1)
+        day_length = MINUTES_PER_DAY * unit
+        night = sunday = holiday = 0
+        for offset in range(start // day_length, -(-end // day_length)):
+            day_start = offset * day_length
+            first = max(start, day_start) - day_start
+            last = min(end, day_start + day_length) - day_start
+            for window_start, window_end in self._night_windows:
+                night += max(
+                    min(last, window_end * unit) - max(first, window_start * unit), 0
+                )
+            is_sunday, is_holiday_ = self._flags(dfrom.date() + timedelta(days=offset))
+            if is_sunday:
+                sunday += last - first
+            if is_holiday_:
+                holiday += last - first
+        total = (end - start) // unit
+        night //= unit
+        sunday //= unit
+        holiday //= unit
+        limits = self._overtime_after + (None,)
+        overtime = [
+            (
+                max(total - low, 0)
+                if high is None
+                else min(max(total - low, 0), high - low)
+            )
+            for low, high in zip(limits, limits[1:])
+        ]
+        return [total - night, night, sunday, holiday, *overtime]
+
+    @staticmethod
+    def _buckets(minutes: list[int]) -> HourBuckets:
+        day, night, sunday, holiday, *overtime = [minutes2hours(m) for m in minutes]
+        return HourBuckets(day, night, sunday, holiday, tuple(overtime))
+
+    def classify(self, dfrom: datetime, dto: datetime) -> HourBuckets:
+        """Hour buckets of one shift"""
+        return self._buckets(self._minutes(dfrom, dto))
+
+    def classify_many(self, shifts: Iterable[tuple[datetime, datetime]]) -> HourBuckets:
+        """Hour bucket totals of many (start, end) shifts, rounded once"""
+        totals = [0] * (4 + len(self._overtime_after))
+        for dfrom, dto in shifts:
+            for i, minutes in enumerate(self._minutes(dfrom, dto)):
+                totals[i] += minutes
+        return self._buckets(totals)
+
+
 def time_range(trange: str) -> tuple[datetime, datetime]:
     """
     2024-01-01T08:00T16:00 -> 2024-01-01T08:00, 2024-01-01T16:00
@@ -208,6 +582,93 @@ def day_night_hours_from_range(trange: str) -> DayNightHours:
     return daynight_hours(dfrom, dto)
 
 
+class TimeRangeError(ValueError):
+    """Invalid time range in a batch, with the index of its row"""
+
+    def __init__(self, row: int, value, reason: str):
+        super().__init__(f"Row {row}: wrong TimeRange {value!r}: {reason}")
+        self.row = row
+        self.value = value
+        self.reason = reason
+
+
+def _seconds_of_day(value: time) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+@lru_cache(maxsize=4096)
+def _time_pair_seconds(tfrom: str, tto: str) -> tuple[int, int]:
+    """Start and end seconds from the midnight of the range date, end on the next day if before start"""
+    start = _seconds_of_day(time.fromisoformat(tfrom))
+    end = _seconds_of_day(time.fromisoformat(tto))
+    if start > end:
+        end += 24 * 3600
+    return start, end
+
+
+def time_ranges_many(tranges: Iterable[str], *, errors: str = "raise"):
+    """
+    Parse many time ranges (as time_range) to datetime64[s] start and end arrays.
+
+    Every distinct date is parsed once per call and the time pairs are kept
+    in a cache shared by all calls, since timesheets repeat the same hours.
+
+    Parameters:
+    tranges: Strings like 2024-01-01T08:00T16:00 or 2024-01-01 09:00 17:00.
+    errors: "raise" raises TimeRangeError for the first invalid row,
+            "coerce" returns NaT start and end for invalid rows.
+
+    Returns:
+    tuple: (starts, ends) datetime64[s] arrays.
+    """
+    if np is None:
+        raise ImportError("time_ranges_many requires numpy")
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce': {errors!r}")
+    if isinstance(tranges, np.ndarray):
+        tranges = tranges.tolist()
+    nat = np.iinfo(np.int64).min
+    epoch = date(1970, 1, 1).toordinal()
+    day_seconds = {}
+    starts = []
+    ends = []
+    for row, trange in enumerate(tranges):
+        try:
+            if "T" in trange:
+                parts = trange.split("T")
+            elif " " in trange:
+                parts = trange.split()
+            else:
+                raise ValueError("no T or space separator")
+            if len(parts) != 3:
+                raise ValueError("expected a date and two times")
+            dat, tfrom, tto = parts
+            midnight = day_seconds.get(dat)
+            if midnight is None:
+                midnight = (date.fromisoformat(dat).toordinal() - epoch) * 24 * 3600
+                day_seconds[dat] = midnight
+            start, end = _time_pair_seconds(tfrom, tto)
+        except (TypeError, ValueError) as error:
+            if errors == "raise":
+                raise TimeRangeError(row, trange, str(error)) from None
+            starts.append(nat)
+            ends.append(nat)
+            continue
+        starts.append(midnight + start)
+        ends.append(midnight + end)
+    return (
+        np.array(starts, dtype=np.int64).view("datetime64[s]"),
+        np.array(ends, dtype=np.int64).view("datetime64[s]"),
+    )
+
+
+def day_night_hours_from_ranges(
+    tranges: Iterable[str], *, errors: str = "raise"
+) -> DayNightHoursArray:
+    """Day and night hours of many time ranges, NaN for invalid rows when errors="coerce" """
+    return daynight_hours_many(*time_ranges_many(tranges, errors=errors))
+
+
 def misthos_hour_diff(year: int, misthos: float):
     hour = misthos / 25 * 6 / 40
     oktaoro = hour * 8
@@ -222,11 +683,7 @@ def misthos_hour_diff(year: int, misthos: float):
     return year, total_days, round(total_delta, 2)
 
 
-def orthodox_easter(year: int) -> date:
-    """
-    Υπολογισμός Ορθόδοξου Πάσχα (Gregorian ημερομηνία)
-    με παραλλαγή του Meeus για το Ιουλιανό Πάσχα + διόρθωση 13 ημερών (1900–2099).
-    """
+def _orthodox_easter(year: int) -> date:
     # Meeus Julian algorithm για Πάσχα στο Ιουλιανό ημερολόγιο
     a = year % 4
     b = year % 7
@@ -243,7 +700,21 @@ def orthodox_easter(year: int) -> date:
     return gregorian_easter
 
 
-def greek_holidays(year: int) -> dict:
+# Προϋπολογισμένες ημερομηνίες Πάσχα για 1900–2099
+ORTHODOX_EASTER = {year: _orthodox_easter(year) for year in range(1900, 2100)}
+
+
+def orthodox_easter(year: int) -> date:
+    """
+    Υπολογισμός Ορθόδοξου Πάσχα (Gregorian ημερομηνία)
+    με παραλλαγή του Meeus για το Ιουλιανό Πάσχα + διόρθωση 13 ημερών (1900–2099).
+    """
+    pascha = ORTHODOX_EASTER.get(year)
+    return pascha if pascha is not None else _orthodox_easter(year)
+
+
+@lru_cache(maxsize=None)
+def _greek_holidays(year: int) -> tuple[tuple[str, date], ...]:
     pascha = orthodox_easter(year)
 
     clean_monday = pascha - timedelta(days=48)
@@ -251,18 +722,174 @@ def greek_holidays(year: int) -> dict:
     easter_monday = pascha + timedelta(days=1)
     holy_spirit_monday = pascha + timedelta(days=50)
 
-    return {
-        "Πρωτοχρονιά": date(year, 1, 1),
-        "Θεοφάνεια": date(year, 1, 6),
-        "Επανάσταση του 1821": date(year, 3, 25),
-        "Πρωτομαγιά": date(year, 5, 1),
-        "Κοίμηση της Θεοτόκου": date(year, 8, 15),
-        "Επέτειος του Όχι": date(year, 10, 28),
-        "Χριστούγεννα": date(year, 12, 25),
-        "Σύναξη της Θεοτόκου": date(year, 12, 26),
-        "Καθαρά Δευτέρα": clean_monday,
-        "Μεγάλη Παρασκευή": good_friday,
-        "Κυριακή του Πάσχα": pascha,
-        "Δευτέρα του Πάσχα": easter_monday,
-        "Δευτέρα του Αγίου Πνεύματος": holy_spirit_monday,
-    }
+    return (
+        ("Πρωτοχρονιά", date(year, 1, 1)),
+        ("Θεοφάνεια", date(year, 1, 6)),
+        ("Επανάσταση του 1821", date(year, 3, 25)),
+        ("Πρωτομαγιά", date(year, 5, 1)),
+        ("Κοίμηση της Θεοτόκου", date(year, 8, 15)),
+        ("Επέτειος του Όχι", date(year, 10, 28)),
+        ("Χριστούγεννα", date(year, 12, 25)),
+        ("Σύναξη της Θεοτόκου", date(year, 12, 26)),
+        ("Καθαρά Δευτέρα", clean_monday),
+        ("Μεγάλη Παρασκευή", good_friday),
+        ("Κυριακή του Πάσχα", pascha),
+        ("Δευτέρα του Πάσχα", easter_monday),
+        ("Δευτέρα του Αγίου Πνεύματος", holy_spirit_monday),
+    )
+
+
+def greek_holidays(year: int) -> dict:
+    return dict(_greek_holidays(year))
+
+
+@lru_cache(maxsize=None)
+def _holiday_names(year: int) -> dict[date, str]:
+    """Holiday name per date of a year, the fixed holiday name wins on a collision"""
+    names = {}
+    for name, day in _greek_holidays(year):
+        names.setdefault(day, name)
+    return names
+
+
+def is_holiday(day: date) -> bool:
+    """Checks if a date (or datetime) is a Greek public holiday"""
+    if isinstance(day, datetime):
+        day = day.date()
+    return day in _holiday_names(day.year)
+
+
+def holiday_name(day: date) -> str | None:
+    """Name of the Greek public holiday of a date (or datetime), None for other days"""
+    if isinstance(day, datetime):
+        day = day.date()
+    return _holiday_names(day.year).get(day)
+
+
+def is_holiday_many(days) -> "np.ndarray":
+    """Checks many datetime64 values (any unit) for Greek public holidays, NaT is not a holiday"""
+    if np is None:
+        raise ImportError("is_holiday_many requires numpy")
+    days = np.asarray(days).astype("datetime64[D]")
+    valid = days[~np.isnat(days)]
+    if not valid.size:
+        return np.zeros(days.shape, dtype=bool)
+    first_year = int(valid.min().astype("datetime64[Y]").astype(np.int64)) + 1970
+    last_year = int(valid.max().astype("datetime64[Y]").astype(np.int64)) + 1970
+    holidays = np.array(
+        [
+            day
+            for year in range(first_year, last_year + 1)
+            for day in _holiday_names(year)
+        ],
+        dtype="datetime64[D]",
+    )
+    return np.isin(days, holidays)
+
+
+# magic, first year, last year, number of days
+CALENDAR_HEADER = struct.Struct("<8sHHI")
+CALENDAR_MAGIC = b"PYGRWCAL"
+
+
+class WorkingCalendar:
+    """Precomputed working days (Monday to Friday except greek_holidays) of a year range.
+
+    A bit per day marks the working days and prefix sums of the working days
+    make every count an O(1) lookup. The calendar can be saved to a small
+    binary file, which load memory-maps instead of rebuilding the calendar.
+
+    parameters:
+        first_year: First year of the calendar (1900-2099, the orthodox_easter range).
+        last_year: Last year of the calendar.
+        extra_holidays: Additional non working dates, e.g. local holidays.
+    """
+
+    def __init__(
+        self, first_year: int, last_year: int, extra_holidays: Iterable[date] = ()
+    ):
+        if not 1900 <= first_year <= last_year <= 2099:
+            raise ValueError(f"Invalid calendar years: {first_year}-{last_year}")
+        origin = date(first_year, 1, 1).toordinal()
+        days = date(last_year, 12, 31).toordinal() - origin + 1
+        holidays = {day.toordinal() for day in extra_holidays}
+        for year in range(first_year, last_year + 1):
+            holidays.update(day.toordinal() for day in _holiday_names(year))
+        bits = bytearray((days + 7) // 8)
+        prefix = array("I", [0])
+        count = 0
+        for index in range(days):
+            ordinal = origin + index
+            # date.fromordinal(ordinal).weekday() == (ordinal + 6) % 7
+            if (ordinal + 6) % 7 < SATURDAY and ordinal not in holidays:
+                bits[index >> 3] |= 1 << (index & 7)
+                count += 1
+            prefix.append(count)
+        self._set_tables(first_year, last_year, bits, prefix)
+
+    def _set_tables(self, first_year: int, last_year: int, bits, prefix) -> None:
+        self.first_year = first_year
+        self.last_year = last_year
+        self._origin = date(first_year, 1, 1).toordinal()
+        self._days = len(prefix) - 1
+        self._bits = bits
+        self._prefix = prefix
+
+    def _index(self, day: date) -> int:
+        index = day.toordinal() - self._origin
+        if not 0 <= index < self._days:
+            raise ValueError(
+                f"{day} is outside the calendar years {self.first_year}-{self.last_year}"
+            )
+        return index
+
+    def is_working_day(self, day: date) -> bool:
+        index = self._index(day)
+        return bool(self._bits[index >> 3] >> (index & 7) & 1)
+
+    def working_days_between(self, date_from: date, date_to: date) -> int:
+        """Working days from date_from to date_to, both included (0 if date_to < date_from)"""
+        if date_to < date_from:
+            return 0
+        return (
+            self._prefix[self._index(date_to) + 1]
+            - self._prefix[self._index(date_from)]
+        )
+
+    def working_days_in_month(self, year: int, month: int) -> int:
+        return self.working_days_between(
+            date(year, month, 1), date(year, month, monthrange(year, month)[1])
+        )
+
+    def save(self, path) -> None:
+        """Writes the calendar to a binary file (header, prefix sums, bits)"""
+        prefix = array("I", self._prefix)
+        if sys.byteorder != "little":  # pragma: no cover - little endian file
+            prefix.byteswap()
+        with open(path, "wb") as file:
+            file.write(
+                CALENDAR_HEADER.pack(
+                    CALENDAR_MAGIC, self.first_year, self.last_year, self._days
+                )
+            )
+            file.write(prefix.tobytes())
+            file.write(bytes(self._bits))
+
+    @classmethod
+    def load(cls, path) -> "WorkingCalendar":
+        """Memory-maps a calendar file written by save"""
+        with open(path, "rb") as file:
+            buffer = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        if len(buffer) < CALENDAR_HEADER.size:
+            raise ValueError(f"Not a working calendar file: {path}")
+        magic, first_year, last_year, days = CALENDAR_HEADER.unpack_from(buffer)
+        prefix_end = CALENDAR_HEADER.size + 4 * (days + 1)
+        if magic != CALENDAR_MAGIC or len(buffer) != prefix_end + (days + 7) // 8:
+            raise ValueError(f"Not a working calendar file: {path}")
+        prefix = buffer[CALENDAR_HEADER.size : prefix_end].cast("I")
+        if sys.byteorder != "little":  # pragma: no cover - little endian file
+            prefix = array("I", prefix)
+            prefix.byteswap()
+        calendar = cls.__new__(cls)
+        calendar._set_tables(first_year, last_year, buffer[prefix_end:], prefix)
+        return calendar
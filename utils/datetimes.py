@@ -1,5 +1,12 @@
-import re
-from datetime import datetime
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
 
 
 def iso2gr(iso_date_str: str) -> str:
@@ -78,6 +85,342 @@ def iso2year_month(isodate: str) -> tuple[int, int]:
     return int(year), int(month)
 
 
+@dataclass(frozen=True)
+class GreekDateError:
+    """Why a value is not a valid Greek date, position is the offending character index"""
+
+    value: object
+    reason: str
+    position: int | None = None
+
+    def __str__(self) -> str:
+        where = "" if self.position is None else f" at position {self.position}"
+        return f"{self.value!r} is not a valid Greek date: {self.reason}{where}"
+
+
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+GR_DATE_DIGIT_POSITIONS = (0, 1, 3, 4, 6, 7, 8, 9)
+
+
+def parse_gr_date(gr_date: str) -> date | GreekDateError:
+    """
+    Validate and parse a Greek date string (DD/MM/YYYY) in a single pass.
+
+    Checks length, separators, digit positions and calendar validity
+    (month lengths, leap years) without regex or strptime.
+
+    Parameters:
+    gr_date (str): Date string in Greek format.
+
+    Returns:
+    date: A date object, or a GreekDateError describing the problem.
+    """
+    if type(gr_date) is not str:
+        return GreekDateError(gr_date, "not a string")
+    if len(gr_date) != 10:
+        return GreekDateError(gr_date, "wrong length")
+    if gr_date[2] != "/":
+        return GreekDateError(gr_date, "wrong separator", 2)
+    if gr_date[5] != "/":
+        return GreekDateError(gr_date, "wrong separator", 5)
+    digits = gr_date[:2] + gr_date[3:5] + gr_date[6:]
+    if not (digits.isascii() and digits.isdigit()):
+        for position in GR_DATE_DIGIT_POSITIONS:
+            if gr_date[position] not in "0123456789":
+                return GreekDateError(gr_date, "not a digit", position)
+    day = int(gr_date[:2])
+    month = int(gr_date[3:5])
+    year = int(gr_date[6:])
+    if year == 0:
+        return GreekDateError(gr_date, "invalid year", 6)
+    if not 1 <= month <= 12:
+        return GreekDateError(gr_date, "invalid month", 3)
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        month_days = 29
+    else:
+        month_days = DAYS_IN_MONTH[month]
+    if not 1 <= day <= month_days:
+        return GreekDateError(gr_date, "invalid day", 0)
+    return date(year, month, day)
+
+
 def is_greek_date(grdate: str) -> bool:
-    """Checks if a string is in Greek date format DD/MM/YYYY"""
-    return re.match(r"\d{2}\/\d{2}\/\d{4}", grdate, re.I) is not None
+    """Checks if a string is a valid Greek date DD/MM/YYYY"""
+    return isinstance(parse_gr_date(grdate), date)
+
+
+def greek_date_mask(gr_dates: Iterable[str]):
+    """
+    Validity of many Greek date strings.
+
+    Parameters:
+    gr_dates: Sequence or NumPy array of strings.
+
+    Returns:
+    list of bool, or a NumPy bool array for NumPy input.
+    """
+    if np is not None and isinstance(gr_dates, np.ndarray):
+        mask = [
+            isinstance(parse_gr_date(value), date)
+            for value in gr_dates.ravel().tolist()
+        ]
+        return np.array(mask, dtype=bool).reshape(gr_dates.shape)
+    return [isinstance(parse_gr_date(value), date) for value in gr_dates]
+
+
+class DateConversionError(ValueError):
+    """Invalid value in a batch date conversion, with the index of its row"""
+
+    def __init__(self, row: int, value, expected: str):
+        super().__init__(f"Row {row}: {value!r} is not a valid {expected} date")
+        self.row = row
+        self.value = value
+
+
+def _iso_date_parts(iso_date) -> tuple[int, int, int] | None:
+    """(year, month, day) of a YYYY-MM-DD string sliced at fixed positions, None if malformed"""
+    if type(iso_date) is not str or len(iso_date) != 10:
+        return None
+    if iso_date[4] != "-" or iso_date[7] != "-":
+        return None
+    digits = iso_date[:4] + iso_date[5:7] + iso_date[8:]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    return int(iso_date[:4]), int(iso_date[5:7]), int(iso_date[8:])
+
+
+def _fast_gr2date(gr_date) -> date | None:
+    parsed = parse_gr_date(gr_date)
+    return parsed if isinstance(parsed, date) else None
+
+
+def _fast_gr2iso(gr_date) -> str | None:
+    if _fast_gr2date(gr_date) is None:
+        return None
+    return f"{gr_date[6:]}-{gr_date[3:5]}-{gr_date[:2]}"
+
+
+def _fast_iso2gr(iso_date) -> str | None:
+    parts = _iso_date_parts(iso_date)
+    if parts is None:
+        return None
+    try:
+        date(*parts)
+    except ValueError:
+        return None
+    return f"{iso_date[8:]}/{iso_date[5:7]}/{iso_date[:4]}"
+
+
+def _fast_date2gr(date_obj) -> str | None:
+    if not isinstance(date_obj, date):
+        return None
+    return date_obj.strftime("%d/%m/%Y")
+
+
+def _convert_many(
+    values: Iterable,
+    convert: Callable,
+    expected: str,
+    errors: str,
+    memoize: bool,
+) -> list:
+    """Applies convert to every value, convert returns None for invalid values.
+
+    NumPy arrays of any shape are flattened, rows are their flat (C order) indices.
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce': {errors!r}")
+    if np is not None and isinstance(values, np.ndarray):
+        values = values.ravel().tolist()
+    cache = {}
+    results = []
+    for row, value in enumerate(values):
+        if memoize and value in cache:
+            result = cache[value]
+        else:
+            result = convert(value)
+            if memoize:
+                cache[value] = result
+        if result is None and errors == "raise":
+            raise DateConversionError(row, value, expected)
+        results.append(result)
+    return results
+
+
+def gr2date_many(
+    gr_dates: Iterable[str],
+    *,
+    errors: str = "raise",
+    memoize: bool = True,
+    as_datetime64: bool = False,
+):
+    """
+    Convert many Greek date strings (DD/MM/YYYY) to date objects.
+
+    Parameters:
+    gr_dates: Sequence or NumPy array of date strings in Greek format, arrays of
+              more dimensions are flattened (rows are flat indices).
+    errors: "raise" raises DateConversionError with the row of the first invalid value,
+            "coerce" returns None (NaT) for invalid values.
+    memoize: Convert each distinct string once.
+    as_datetime64: Return a NumPy datetime64[D] array instead of a list.
+
+    Returns:
+    list of date objects, or datetime64[D] array (of the shape of an array input).
+    """
+    dates = _convert_many(gr_dates, _fast_gr2date, "Greek", errors, memoize)
+    if as_datetime64:
+        if np is None:
+            raise ImportError("as_datetime64 requires numpy")
+        array = np.array(dates, dtype="datetime64[D]")
+        if isinstance(gr_dates, np.ndarray):
+            return array.reshape(gr_dates.shape)
+        return array
+    return dates
+
+
+def gr2iso_many(
+    gr_dates: Iterable[str], *, errors: str = "raise", memoize: bool = True
+) -> list:
+    """
+    Convert many Greek date strings (DD/MM/YYYY) to ISO 8601 date strings (YYYY-MM-DD).
+
+    Parameters and errors as in gr2date_many.
+    """
+    return _convert_many(gr_dates, _fast_gr2iso, "Greek", errors, memoize)
+
+
+def iso2gr_many(
+    iso_dates: Iterable[str], *, errors: str = "raise", memoize: bool = True
+) -> list:
+    """
+    Convert many ISO 8601 date strings (YYYY-MM-DD) to Greek date strings (DD/MM/YYYY).
+
+    Parameters and errors as in gr2date_many.
+    """
+    return _convert_many(iso_dates, _fast_iso2gr, "ISO", errors, memoize)
+
+
+def date2gr_many(dates, *, errors: str = "raise", memoize: bool = True) -> list:
+    """
+    Convert many date objects, or a NumPy datetime64 array, to Greek date strings (DD/MM/YYYY).
+
+    Parameters and errors as in gr2date_many, NaT is an invalid value.
+    """
+    if np is not None and isinstance(dates, np.ndarray):
+        dates = dates.astype("datetime64[D]").ravel().tolist()
+    return _convert_many(dates, _fast_date2gr, "date", errors, memoize)
+
+
+def _decode_date_fields(fields: "np.ndarray", date_format: str):
+    """datetime64[D] dates (NaT if invalid) and validity mask of (n, 10) ASCII byte fields"""
+    if date_format == "gr":
+        day_pos, month_pos, year_pos, separator, separator_pos = (
+            [0, 1],
+            [3, 4],
+            [6, 7, 8, 9],
+            ord("/"),
+            [2, 5],
+        )
+    elif date_format == "iso":
+        day_pos, month_pos, year_pos, separator, separator_pos = (
+            [8, 9],
+            [5, 6],
+            [0, 1, 2, 3],
+            ord("-"),
+            [4, 7],
+        )
+    else:
+        raise ValueError(f"date_format must be 'gr' or 'iso': {date_format!r}")
+    digits = fields.astype(np.int32) - ord("0")
+    digit_pos = day_pos + month_pos + year_pos
+    valid = np.all((digits[:, digit_pos] >= 0) & (digits[:, digit_pos] <= 9), axis=1)
+    valid &= np.all(fields[:, separator_pos] == separator, axis=1)
+    day = digits[:, day_pos] @ np.array([10, 1])
+    month = digits[:, month_pos] @ np.array([10, 1])
+    year = digits[:, year_pos] @ np.array([1000, 100, 10, 1])
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_days = np.array(DAYS_IN_MONTH)[np.clip(month, 0, 12)] + (leap & (month == 2))
+    valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+    valid &= day <= month_days
+    year = np.where(valid, year, 1970)
+    month = np.where(valid, month, 1)
+    day = np.where(valid, day, 1)
+    months = (year - 1970).astype("datetime64[Y]").astype("datetime64[M]") + (month - 1)
+    dates = months.astype("datetime64[D]") + (day - 1)
+    dates[~valid] = np.datetime64("NaT", "D")
+    return dates, valid
+
+
+def read_date_column(
+    path,
+    *,
+    offset: int,
+    record_length: int | None = None,
+    date_format: str = "gr",
+    header_bytes: int = 0,
+    errors: str = "raise",
+    block_size: int = 1_000_000,
+):
+    """
+    Read a date field of a fixed-width records file into a datetime64[D] array.
+
+    The file is memory-mapped and the 10 date bytes of every record are decoded
+    straight from the buffer, without creating Python strings. Validation rules
+    are those of parse_gr_date (date_format="gr", DD/MM/YYYY) or of ISO dates
+    (date_format="iso", YYYY-MM-DD). A last record without line terminator is read too.
+
+    Parameters:
+    path: File path.
+    offset: Byte offset of the date field inside a record.
+    record_length: Bytes per record including the line terminator,
+                   by default up to and including the first newline.
+    date_format: "gr" or "iso".
+    header_bytes: Bytes to skip at the start of the file.
+    errors: "raise" raises DateConversionError with the row of the first invalid date,
+            "coerce" returns NaT for invalid dates.
+    block_size: Records decoded at once, bounds the temporary memory.
+
+    Returns:
+    np.ndarray: datetime64[D] array with one date per record.
+    """
+    if np is None:
+        raise ImportError("read_date_column requires numpy")
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce': {errors!r}")
+    if os.path.getsize(path) <= header_bytes:
+        return np.empty(0, dtype="datetime64[D]")
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")[header_bytes:]
+    if record_length is None:
+        newlines = np.flatnonzero(buffer[: 1 << 20] == ord("\n"))
+        if not newlines.size:
+            raise ValueError("record_length not given and no newline found")
+        record_length = int(newlines[0]) + 1
+    if not 0 <= offset <= record_length - 10:
+        raise ValueError(
+            f"Date field at {offset} exceeds record length {record_length}"
+        )
+    full_records, remainder = divmod(buffer.size, record_length)
+    records = buffer[: full_records * record_length].reshape(
+        full_records, record_length
+    )
+    fields = records[:, offset : offset + 10]
+    if remainder >= offset + 10:  # last record without line terminator
+        tail = buffer[full_records * record_length :][offset : offset + 10]
+        fields_blocks = [fields, tail.reshape(1, 10)]
+    else:
+        fields_blocks = [fields]
+    expected = "Greek" if date_format == "gr" else "ISO"
+    result = np.empty(sum(len(block) for block in fields_blocks), dtype="datetime64[D]")
+    row = 0
+    for block in fields_blocks:
+        for start in range(0, len(block), block_size):
+            chunk = block[start : start + block_size]
+            dates, valid = _decode_date_fields(chunk, date_format)
+            if errors == "raise" and not valid.all():
+                bad = int(np.flatnonzero(~valid)[0])
+                value = chunk[bad].tobytes().decode("ascii", "replace")
+                raise DateConversionError(row + bad, value, expected)
+            result[row : row + len(chunk)] = dates
+            row += len(chunk)
+    return result
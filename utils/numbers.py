@@ -1,3 +1,25 @@
+import re
+from collections.abc import Iterable
+from decimal import Decimal
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# Optional sign, digits either ungrouped or grouped by three with dots, optional decimal comma
+GR_NUMBER_RE = re.compile(r"[-+]?(?:\d{1,3}(?:\.\d{3})+|\d+)(?:,\d+)?", re.ASCII)
+
+
+class NumberConversionError(ValueError):
+    """Invalid value in a batch number conversion, with the index of its row"""
+
+    def __init__(self, row: int, value):
+        super().__init__(f"Row {row}: {value!r} is not a valid Greek number")
+        self.row = row
+        self.value = value
+
+
 def gr2float(gr_number_str: str) -> float:
     """Convert a Greek-formatted number string (1.234.567,89) to a float representation."""
     no_thousands = gr_number_str.replace(".", "")
@@ -5,11 +27,13 @@ def gr2float(gr_number_str: str) -> float:
     return float(standard_format)
 
 
+# Swaps the thousands and decimal separators of a formatted number
+GR_SEPARATORS_TABLE = str.maketrans(",.", ".,")
+
+
 def float2gr(number: float, decimals=2) -> str:
     """Convert a float number to a Greek-formatted number string (1.234.567,89)."""
-    standard_format = f"{number:,.{decimals}f}"
-    gr_format = standard_format.replace(",", "X").replace(".", ",").replace("X", ".")
-    return gr_format
+    return f"{number:,.{decimals}f}".translate(GR_SEPARATORS_TABLE)
 
 
 def float2gr_empty_zero(number: float, decimals=2) -> str:
@@ -17,3 +41,320 @@ def float2gr_empty_zero(number: float, decimals=2) -> str:
     if number == 0:
         return ""
     return float2gr(number, decimals)
+
+
+def float2gr_many(numbers: Iterable[float], decimals=2, empty_zero=False) -> list[str]:
+    """Convert many float numbers (a list or a NumPy array) to Greek-formatted number strings.
+
+    All numbers are formatted and joined, and the separators of the joined
+    text are swapped with a single translate.
+    empty_zero: Return empty strings for zero values, as float2gr_empty_zero.
+    """
+    if np is not None and isinstance(numbers, np.ndarray):
+        numbers = numbers.ravel().tolist()
+    spec = f",.{decimals}f"
+    if empty_zero:
+        formatted = [format(number, spec) if number != 0 else "" for number in numbers]
+    else:
+        formatted = [format(number, spec) for number in numbers]
+    if not formatted:
+        return []
+    return "\n".join(formatted).translate(GR_SEPARATORS_TABLE).split("\n")
+
+
+def is_greek_number(gr_number_str: str) -> bool:
+    """Checks if a string is a Greek-formatted number with valid thousands grouping."""
+    return (
+        type(gr_number_str) is str and GR_NUMBER_RE.fullmatch(gr_number_str) is not None
+    )
+
+
+def gr2decimal(gr_number_str: str) -> Decimal:
+    """Convert a Greek-formatted number string (1.234.567,89) to an exact Decimal."""
+    if not is_greek_number(gr_number_str):
+        raise ValueError(f"{gr_number_str!r} is not a valid Greek number")
+    return Decimal(gr_number_str.replace(".", "").replace(",", "."))
+
+
+def gr2decimal_many(gr_numbers: Iterable[str], *, errors: str = "raise") -> list:
+    """Convert many Greek-formatted number strings to Decimals.
+
+    errors: "raise" raises NumberConversionError with the row of the first invalid value,
+            "coerce" returns None for invalid values.
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce': {errors!r}")
+    if np is not None and isinstance(gr_numbers, np.ndarray):
+        gr_numbers = gr_numbers.ravel().tolist()
+    result = []
+    for row, value in enumerate(gr_numbers):
+        if is_greek_number(value):
+            result.append(Decimal(value.replace(".", "").replace(",", ".")))
+        elif errors == "raise":
+            raise NumberConversionError(row, value)
+        else:
+            result.append(None)
+    return result
+
+
+# Up to 15 digits the mantissa is exact in a float64, and so is 10**k for k <= 22,
+# so a single division gives the correctly rounded value, same as float()
+FAST_PATH_DIGITS = 15
+
+
+# Rows converted at once, bounds the (rows, chars) temporaries of a block
+NUMBER_BLOCK_SIZE = 65_536
+# Longer cells take the scalar path, so they never set the width of a block
+MAX_VECTOR_NUMBER_LENGTH = 64
+
+
+def _greek_number_values(gr_numbers) -> tuple:
+    """(1-d cells, shape) of a list or NumPy array input"""
+    if isinstance(gr_numbers, np.ndarray):
+        return gr_numbers.ravel(), gr_numbers.shape
+    values = list(gr_numbers)
+    return values, (len(values),)
+
+
+def _block_texts(block) -> tuple["np.ndarray", "np.ndarray"]:
+    """Fixed width str array of a block of cells and the mask of the too long cells.
+
+    Too long cells are left empty in the array, at most MAX_VECTOR_NUMBER_LENGTH
+    characters wide. Non str cells of a list are empty (invalid), those of a
+    non str array are converted with str as astype(str) does.
+    """
+    if isinstance(block, np.ndarray) and block.dtype.kind in "UT":
+        lengths = np.strings.str_len(block)
+        long = lengths > MAX_VECTOR_NUMBER_LENGTH
+        width = max(int(lengths[~long].max(initial=0)), 1)
+        if block.dtype.kind == "T" or block.dtype.itemsize // 4 > width:
+            # truncates only the too long cells, which are then emptied
+            block = block.astype(f"U{width}")
+        if long.any():
+            block = np.where(long, "", block)
+        return block, long
+    if isinstance(block, np.ndarray):
+        cells = [str(value) for value in block.tolist()]
+    else:
+        cells = [value if type(value) is str else "" for value in block]
+    long = np.array([len(cell) > MAX_VECTOR_NUMBER_LENGTH for cell in cells], bool)
+    texts = [cell if len(cell) <= MAX_VECTOR_NUMBER_LENGTH else "" for cell in cells]
+    return np.array(texts, dtype=str), long
+
+
+def _number_blocks(values, block_size: int):
+    """Yields (first row, cells, fixed width str array, too long mask) per block of rows"""
+    if block_size < 1:
+        raise ValueError(f"block_size must be positive: {block_size}")
+    for start in range(0, len(values), block_size):
+        block = values[start : start + block_size]
+        texts, long = _block_texts(block)
+        yield start, block, texts, long
+
+
+def _raise_first_invalid(values, valid: "np.ndarray", offset: int = 0) -> None:
+    if not valid.all():
+        row = int(np.flatnonzero(~valid)[0])
+        value = values[row]
+        raise NumberConversionError(
+            offset + row, value.item() if hasattr(value, "item") else value
+        )
+
+
+def _greek_number_parts(texts: "np.ndarray", max_digits: int):
+    """Vectorized is_greek_number over a 1-d str array, splitting the numbers.
+
+    Works on the (rows, chars) code point matrix of the array. Returns the
+    validity mask, the sign, the digits as an int64 mantissa, the number of
+    decimal digits and whether the mantissa is exact (at most max_digits
+    digits, max_digits must be at most 18).
+    """
+    width = texts.dtype.itemsize // 4
+    if width == 0:
+        nothing = np.zeros(len(texts), dtype=bool)
+        zeros = np.zeros(len(texts), dtype=np.int64)
+        return nothing, nothing, zeros, zeros, nothing
+    codes = texts.view(np.uint32).reshape(len(texts), width)
+    # blocks are at most MAX_VECTOR_NUMBER_LENGTH wide, int16 positions keep the
+    # (rows, chars) temporaries small
+    length = np.strings.str_len(texts).astype(np.int16)[:, None]
+    position = np.arange(width, dtype=np.int16)
+    inside = position < length
+    is_digit = (codes >= ord("0")) & (codes <= ord("9"))
+    is_dot = codes == ord(".")
+    is_comma = (codes == ord(",")) & inside
+    negative = codes[:, 0] == ord("-")
+    start = (negative | (codes[:, 0] == ord("+")))[:, None]
+    commas = is_comma.sum(axis=1, dtype=np.int16)[:, None]
+    comma = np.where(
+        commas == 1, is_comma.argmax(axis=1).astype(np.int16)[:, None], length
+    )
+    integer_part = inside & (position >= start) & (position < comma)
+    fraction_part = inside & (position > comma)
+    # Grouping dots sit every 4th position counting back from the comma
+    grouped = (is_dot & integer_part).any(axis=1)[:, None]
+    dot_expected = grouped & ((comma - position) & 3 == 0)
+    integer_length = comma - start
+    valid = (
+        (commas <= 1)
+        & (integer_length >= 1)
+        & ~(grouped & (integer_length % 4 == 0))
+        & ((commas == 0) | (length - comma >= 2))
+    )[:, 0]
+    valid &= (np.where(dot_expected, is_dot, is_digit) | ~integer_part).all(axis=1)
+    valid &= (is_digit | ~fraction_part).all(axis=1)
+
+    significant = is_digit & (integer_part | fraction_part)
+    exact = valid & (significant.sum(axis=1) <= max_digits)
+    # Horner's rule column by column, int64 cannot overflow on the exact rows
+    mantissa = np.zeros(len(texts), dtype=np.int64)
+    for column in range(width):
+        digit = codes[:, column].astype(np.int64) - ord("0")
+        mantissa = np.where(significant[:, column], mantissa * 10 + digit, mantissa)
+    decimals = (significant & fraction_part).sum(axis=1)
+    return valid, negative, mantissa, decimals, exact
+
+
+def _parse_greek_numbers(
+    cells, texts: "np.ndarray", long: "np.ndarray"
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """Vectorized is_greek_number and gr2float over a block of cells.
+
+    Returns the float64 values (NaN where invalid) and the validity mask.
+    """
+    valid, negative, mantissa, decimals, fast = _greek_number_parts(
+        texts, FAST_PATH_DIGITS
+    )
+    values = np.where(fast, mantissa / 10.0**decimals, np.nan)
+    values = np.where(negative, -values, values)
+    slow = np.flatnonzero(valid & ~fast)
+    if slow.size:
+        values[slow] = [gr2float(text) for text in texts[slow].tolist()]
+    for row in np.flatnonzero(long).tolist():
+        text = str(cells[row])
+        valid[row] = is_greek_number(text)
+        values[row] = gr2float(text) if valid[row] else np.nan
+    return values, valid
+
+
+def gr2float_many(
+    gr_numbers: Iterable[str],
+    *,
+    errors: str = "raise",
+    block_size: int = NUMBER_BLOCK_SIZE,
+) -> "np.ndarray":
+    """Convert many Greek-formatted number strings to a float64 array.
+
+    Validation (see is_greek_number) and conversion are vectorized over NumPy
+    str arrays of block_size rows, which bounds the temporary memory. Values
+    are the same as gr2float. Requires numpy.
+    errors: "raise" raises NumberConversionError with the row of the first invalid value,
+            "coerce" returns NaN for invalid values.
+    """
+    if np is None:
+        raise ImportError("gr2float_many requires numpy")
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce': {errors!r}")
+    values, shape = _greek_number_values(gr_numbers)
+    result = np.empty(len(values), dtype=np.float64)
+    for start, cells, texts, long in _number_blocks(values, block_size):
+        block_result, valid = _parse_greek_numbers(cells, texts, long)
+        if errors == "raise":
+            _raise_first_invalid(cells, valid, start)
+        result[start : start + len(cells)] = block_result
+    return result.reshape(shape)
+
+
+def gr2cents(gr_number_str: str) -> int:
+    """Convert a Greek-formatted amount (1.234.567,89) to integer cents, without floats.
+
+    Raises ValueError for invalid numbers and for non zero digits beyond the cents.
+    """
+    if not is_greek_number(gr_number_str):
+        raise ValueError(f"{gr_number_str!r} is not a valid Greek number")
+    sign = -1 if gr_number_str[0] == "-" else 1
+    integer, _, fraction = gr_number_str.lstrip("+-").replace(".", "").partition(",")
+    if fraction[2:].strip("0"):
+        raise ValueError(f"{gr_number_str!r} has fractions of a cent")
+    return sign * (int(integer) * 100 + int(fraction[:2].ljust(2, "0")))
+
+
+def cents2gr(cents: int) -> str:
+    """Convert integer cents to a Greek-formatted amount (1.234.567,89), without floats."""
+    sign = "-" if cents < 0 else ""
+    units, cents = divmod(abs(int(cents)), 100)
+    return f"{sign}{units:,}".replace(",", ".") + f",{cents:02d}"
+
+
+# Up to 16 digits the cents (at most 100 times the digits) fit in an int64
+CENTS_EXACT_DIGITS = 16
+
+
+def _cents_block(
+    cells, texts: "np.ndarray", long: "np.ndarray"
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """int64 cents and validity mask of a block of cells"""
+    valid, negative, mantissa, decimals, exact = _greek_number_parts(
+        texts, CENTS_EXACT_DIGITS
+    )
+    exact &= valid
+    cents = np.zeros(len(texts), dtype=np.int64)
+    scale_up = exact & (decimals <= 2)
+    cents[scale_up] = mantissa[scale_up] * 10 ** (2 - decimals[scale_up])
+    scale_down = exact & (decimals > 2)
+    divisor = 10 ** (decimals[scale_down] - 2)
+    quotient, remainder = np.divmod(mantissa[scale_down], divisor)
+    cents[scale_down] = quotient
+    valid[np.flatnonzero(scale_down)[remainder != 0]] = False
+    cents = np.where(negative, -cents, cents)
+    # too many digits for the matrix path, or too long for the block
+    for row in np.flatnonzero((valid & ~exact) | long).tolist():
+        try:
+            row_cents = gr2cents(str(cells[row]))
+        except ValueError:
+            valid[row] = False
+            continue
+        valid[row] = -(2**63) <= row_cents < 2**63
+        if valid[row]:
+            cents[row] = row_cents
+    cents[~valid] = 0
+    return cents, valid
+
+
+def gr2cents_many(
+    gr_numbers: Iterable[str],
+    *,
+    errors: str = "raise",
+    block_size: int = NUMBER_BLOCK_SIZE,
+) -> "np.ndarray":
+    """Convert many Greek-formatted amounts to an int64 array of cents.
+
+    Vectorized in blocks like gr2float_many, exact for any amount that fits in
+    int64. Invalid values are invalid numbers, values with fractions of a cent
+    and values out of the int64 range. Requires numpy.
+    errors: "raise" raises NumberConversionError with the row of the first invalid value,
+            "coerce" returns a masked array (numpy.ma) with the invalid values masked.
+    """
+    if np is None:
+        raise ImportError("gr2cents_many requires numpy")
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce': {errors!r}")
+    values, shape = _greek_number_values(gr_numbers)
+    cents = np.empty(len(values), dtype=np.int64)
+    valid = np.ones(len(values), dtype=bool)
+    for start, cells, texts, long in _number_blocks(values, block_size):
+        block_cents, block_valid = _cents_block(cells, texts, long)
+        if errors == "raise":
+            _raise_first_invalid(cells, block_valid, start)
+        cents[start : start + len(cells)] = block_cents
+        valid[start : start + len(cells)] = block_valid
+    if errors == "raise":
+        return cents.reshape(shape)
+    return np.ma.MaskedArray(cents.reshape(shape), mask=~valid.reshape(shape))
+
+
+def cents2gr_many(cents: Iterable[int]) -> list[str]:
+    """Convert many integer cents (a list or an int64 NumPy array) to Greek-formatted amounts."""
+    if np is not None and isinstance(cents, np.ndarray):
+        cents = cents.ravel().tolist()
+    return [cents2gr(value) for value in cents]
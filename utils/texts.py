@@ -1,8 +1,51 @@
+import sys
+import threading
+import time
 import unicodedata
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
 
-def grup(text: str) -> str:
-    """A function who returns the characters capitalized. Specal Greek characters are handled in order to make string comparisons"""
+GREEK_ACCENTED_UPPER = {
+    "Ά": "Α",
+    "Έ": "Ε",
+    "Ή": "Η",
+    "Ί": "Ι",
+    "Ϊ": "Ι",
+    "Ό": "Ο",
+    "Ϋ": "Υ",
+    "Ύ": "Υ",
+    "Ώ": "Ω",
+}
+
+# Unicode blocks served by the precomputed translation table: Basic Latin,
+# Latin-1, Latin Extended-A/B, Combining Diacritical Marks, Greek and Coptic,
+# Latin Extended Additional and Greek Extended.
+GRUP_TABLE_RANGES = (
+    (0x0000, 0x0250),
+    (0x0300, 0x0400),
+    (0x1E00, 0x2000),
+)
+
+
+class _NotInTable(Exception):
+    """Raised from the translation table for characters it does not cover."""
+
+
+class _GrupTable(dict):
+    """Translation table that aborts `str.translate` on uncovered characters"""
+
+    def __missing__(self, key):
+        raise _NotInTable(key)
+
+
+def _grup_normalize(text: str) -> str:
+    """Reference implementation of grup, used for characters outside the table"""
     # Normalize to NFD (decomposed form) to separate base characters from combining diacritics
     normalized_text = unicodedata.normalize("NFD", text)
     # Remove combining diacritical marks
@@ -12,20 +55,361 @@ def grup(text: str) -> str:
         if unicodedata.category(char) != "Mn"  # Mn = Mark, nonspacing (combining marks)
     )
     uptext = text_without_marks.upper()
-    replaces = {
-        "Ά": "Α",
-        "Έ": "Ε",
-        "Ή": "Η",
-        "Ί": "Ι",
-        "Ϊ": "Ι",
-        "Ό": "Ο",
-        "Ϋ": "Υ",
-        "Ύ": "Υ",
-        "Ώ": "Ω",
-    }
-    return "".join(replaces.get(letter, letter) for letter in uptext)
-
-
-def are_texts_equal(text1: str, text2: str) -> bool:
-    """A function who compares two strings in a case insensitive way, handling special Greek characters"""
-    return grup(text1) == grup(text2)
+    return "".join(GREEK_ACCENTED_UPPER.get(letter, letter) for letter in uptext)
+
+
+def _build_grup_table() -> _GrupTable:
+    """Map every character of GRUP_TABLE_RANGES to its normalized form.
+
+    A character is only included if all combining characters of its
+    decomposition are nonspacing marks, so that translating character by
+    character gives the same result as normalizing the whole string.
+    """
+    table = _GrupTable()
+    for start, end in GRUP_TABLE_RANGES:
+        for codepoint in range(start, end):
+            char = chr(codepoint)
+            decomposed = unicodedata.normalize("NFD", char)
+            if all(
+                unicodedata.combining(part) == 0 or unicodedata.category(part) == "Mn"
+                for part in decomposed
+            ):
+                table[codepoint] = _grup_normalize(char)
+    return table
+
+
+GRUP_TABLE = _build_grup_table()
+
+
+def grup(text: str) -> str:
+    """A function who returns the characters capitalized. Specal Greek characters are handled in order to make string comparisons"""
+    if text.isascii():
+        return text.upper()
+    try:
+        return text.translate(GRUP_TABLE)
+    except _NotInTable:
+        return _grup_normalize(text)
+
+
+@dataclass(frozen=True)
+class GrupCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    bypassed: int
+    entries: int
+    memory_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class GrupCache:
+    """Size-bounded LRU cache around grup for repetitive inputs.
+
+    The cache is thread-safe, so one instance can be shared by threads.
+
+    :param max_entries: Maximum number of cached texts, least recently used are evicted.
+    :param max_length: Texts longer than this are normalized without being cached.
+    """
+
+    def __init__(self, max_entries: int = 65536, max_length: int = 256):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive: {max_entries}")
+        self.max_entries = max_entries
+        self.max_length = max_length
+        self._data: OrderedDict[str, str] = OrderedDict()
+        self._data_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0
+
+    def __call__(self, text: str) -> str:
+        if len(text) > self.max_length:
+            with self._lock:
+                self.bypassed += 1
+            return grup(text)
+        data = self._data
+        with self._lock:
+            normalized = data.get(text)
+            if normalized is not None:
+                data.move_to_end(text)
+                self.hits += 1
+                return normalized
+            self.misses += 1
+        normalized = grup(text)
+        with self._lock:
+            if text not in data:  # else added by another thread meanwhile
+                data[text] = normalized
+                self._data_bytes += sys.getsizeof(text) + sys.getsizeof(normalized)
+                if len(data) > self.max_entries:
+                    old_text, old_normalized = data.popitem(last=False)
+                    self._data_bytes -= sys.getsizeof(old_text) + sys.getsizeof(
+                        old_normalized
+                    )
+                    self.evictions += 1
+        return normalized
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> GrupCacheStats:
+        """Returns counters and the approximate memory footprint in bytes"""
+        with self._lock:
+            return GrupCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                bypassed=self.bypassed,
+                entries=len(self._data),
+                memory_bytes=sys.getsizeof(self._data) + self._data_bytes,
+            )
+
+    def clear(self) -> None:
+        """Drops all cached texts and resets the counters"""
+        with self._lock:
+            self._data.clear()
+            self._data_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.bypassed = 0
+
+
+# Module-level cache shared by cached_grup (the *_gr operators of utils.comparisons)
+# and by every caller passing it, clear it between batches if needed
+GRUP_CACHE = GrupCache()
+
+
+def cached_grup(text: str) -> str:
+    """grup backed by the shared GRUP_CACHE"""
+    return GRUP_CACHE(text)
+
+
+def are_texts_equal(text1: str, text2: str, cache: GrupCache | None = None) -> bool:
+    """A function who compares two strings in a case insensitive way, handling special Greek characters
+
+    cache: Optional GrupCache (e.g. the shared GRUP_CACHE) for repetitive texts,
+           without it nothing is cached.
+    """
+    if cache is None:
+        return grup(text1) == grup(text2)
+    return cache(text1) == cache(text2)
+
+
+def grup_many(texts: Iterable[str]) -> list[str]:
+    """grup over an iterable of texts, normalizing each distinct text once"""
+    normalized = {}
+    result = []
+    for text in texts:
+        value = normalized.get(text)
+        if value is None:
+            value = normalized[text] = grup(text)
+        result.append(value)
+    return result
+
+
+def iter_grup(texts: Iterable[str], cache: GrupCache | None = None) -> Iterator[str]:
+    """Streaming grup over an iterable of texts.
+
+    Repeated texts are served from `cache`, a fresh bounded GrupCache by default.
+    """
+    if cache is None:
+        cache = GrupCache()
+    for text in texts:
+        yield cache(text)
+
+
+def grup_array(texts: "np.ndarray") -> "np.ndarray":
+    """grup over a NumPy array of str or StringDType, keeping the array shape.
+
+    Identical values are normalized once and scattered back with the inverse index.
+    """
+    if np is None:
+        raise ImportError("grup_array requires numpy")
+    texts = np.asarray(texts)
+    if texts.size == 0:
+        return texts.copy()
+    uniques, inverse = np.unique(texts.ravel(), return_inverse=True)
+    if isinstance(texts.dtype, np.dtypes.StringDType):
+        normalized = np.array(grup_many(uniques.tolist()), dtype=texts.dtype)
+    else:
+        normalized = np.array(grup_many(uniques.tolist()), dtype=str)
+    return normalized[inverse].reshape(texts.shape)
+
+
+def levenshtein(text1: str, text2: str, max_distance: int | None = None) -> int:
+    """Edit distance between two strings.
+
+    With `max_distance` the computation stops early and returns max_distance + 1
+    as soon as the distance is known to exceed it.
+    """
+    if len(text1) < len(text2):
+        text1, text2 = text2, text1
+    if max_distance is not None and len(text1) - len(text2) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(text2) + 1))
+    for i, char1 in enumerate(text1, 1):
+        current = [i]
+        for j, char2 in enumerate(text2, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char1 != char2),
+                )
+            )
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+@dataclass(frozen=True)
+class TextIndexStats:
+    entries: int
+    distinct_keys: int
+    ngrams: int
+    build_seconds: float
+    memory_bytes: int
+
+
+class TextIndex:
+    """Index of texts by their grup normalized form.
+
+    Exact (normalized) lookups are answered from a hash map, edit distance
+    lookups from an n-gram inverted index: candidates must share enough
+    n-grams with the query (q-gram lemma) and only those are verified with
+    levenshtein.
+
+    :param texts: Initial texts, each stored with itself as value.
+    :param ngram: Length of the n-grams used for similarity lookups.
+    """
+
+    def __init__(self, texts: Iterable[str] = (), ngram: int = 3):
+        if ngram < 1:
+            raise ValueError(f"ngram must be positive: {ngram}")
+        self.ngram = ngram
+        self._next_id = 0
+        self._values: dict[int, object] = {}
+        self._keys: dict[int, str] = {}
+        self._exact: dict[str, set[int]] = defaultdict(set)
+        self._postings: dict[str, dict[int, int]] = defaultdict(dict)
+        self._by_length: dict[int, set[int]] = defaultdict(set)
+        self.build_seconds = 0.0
+        for text in texts:
+            self.add(text)
+
+    def _ngrams(self, key: str) -> Counter:
+        pad = " " * (self.ngram - 1)
+        padded = f"{pad}{key}{pad}"
+        return Counter(
+            padded[i : i + self.ngram] for i in range(len(padded) - self.ngram + 1)
+        )
+
+    def add(self, text: str, value=None) -> int:
+        """Adds a text (with an optional value, the text itself by default) and returns its entry id"""
+        start = time.perf_counter()
+        entry_id = self._next_id
+        self._next_id += 1
+        key = grup(text)
+        self._values[entry_id] = text if value is None else value
+        self._keys[entry_id] = key
+        self._exact[key].add(entry_id)
+        self._by_length[len(key)].add(entry_id)
+        for gram, count in self._ngrams(key).items():
+            self._postings[gram][entry_id] = count
+        self.build_seconds += time.perf_counter() - start
+        return entry_id
+
+    def remove(self, entry_id: int) -> None:
+        """Removes an entry by the id returned from add"""
+        start = time.perf_counter()
+        key = self._keys.pop(entry_id)
+        del self._values[entry_id]
+        self._discard(self._exact, key, entry_id)
+        self._discard(self._by_length, len(key), entry_id)
+        for gram in self._ngrams(key):
+            postings = self._postings[gram]
+            del postings[entry_id]
+            if not postings:
+                del self._postings[gram]
+        self.build_seconds += time.perf_counter() - start
+
+    @staticmethod
+    def _discard(buckets: dict, bucket_key, entry_id: int) -> None:
+        bucket = buckets[bucket_key]
+        bucket.discard(entry_id)
+        if not bucket:
+            del buckets[bucket_key]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, text: str) -> bool:
+        return grup(text) in self._exact
+
+    def find_equal(self, text: str) -> list:
+        """Values of all entries equal to text after grup normalization"""
+        return [self._values[i] for i in sorted(self._exact.get(grup(text), ()))]
+
+    def find_similar(
+        self, text: str, max_distance: int = 1
+    ) -> list[tuple[object, int]]:
+        """(value, distance) of all entries within max_distance edits of text, closest first"""
+        key = grup(text)
+        grams = self._ngrams(key)
+        # Padded n-grams of a string of length n are n + ngram - 1, an edit destroys at most ngram of them
+        min_common = len(key) + self.ngram - 1 - max_distance * self.ngram
+        if min_common > 0:
+            common = Counter()
+            for gram, count in grams.items():
+                for entry_id, entry_count in self._postings.get(gram, {}).items():
+                    common[entry_id] += min(count, entry_count)
+            candidates = [i for i, shared in common.items() if shared >= min_common]
+        else:
+            candidates = [
+                entry_id
+                for length in range(
+                    len(key) - max_distance, len(key) + max_distance + 1
+                )
+                for entry_id in self._by_length.get(length, ())
+            ]
+        matches = []
+        for entry_id in candidates:
+            distance = levenshtein(key, self._keys[entry_id], max_distance)
+            if distance <= max_distance:
+                matches.append((distance, entry_id))
+        matches.sort()
+        return [(self._values[entry_id], distance) for distance, entry_id in matches]
+
+    def stats(self) -> TextIndexStats:
+        """Returns the index size, accumulated build time and approximate memory footprint in bytes"""
+        memory = sum(
+            sys.getsizeof(container)
+            for container in (
+                self._values,
+                self._keys,
+                self._exact,
+                self._postings,
+                self._by_length,
+            )
+        )
+        memory += sum(sys.getsizeof(key) for key in self._keys.values())
+        memory += sum(sys.getsizeof(ids) for ids in self._exact.values())
+        memory += sum(sys.getsizeof(ids) for ids in self._by_length.values())
+        memory += sum(
+            sys.getsizeof(gram) + sys.getsizeof(postings)
+            for gram, postings in self._postings.items()
+        )
+        return TextIndexStats(
+            entries=len(self._keys),
+            distinct_keys=len(self._exact),
+            ngrams=len(self._postings),
+            build_seconds=self.build_seconds,
+            memory_bytes=memory,
+        )